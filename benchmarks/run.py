@@ -0,0 +1,182 @@
+"""
+Benchmark OrderBook/MatchingEngine on synthetic order flow.
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --compare bench.json --threshold 0.10
+
+Each scenario reports throughput, per-operation latency percentiles and
+peak traced memory as JSON. With ``--compare`` the run exits non-zero if
+any scenario's throughput fell, or its p99 latency rose, by more than the
+threshold relative to the baseline file.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from src.core.depth_index import DepthIndex
+from src.core.matching_engine import MatchingEngine
+from src.core.order import Order
+from src.core.order_book import OrderBook
+
+from .workloads import Workload, build_workloads
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def _replay(book: OrderBook, engine: MatchingEngine, events, latencies=None) -> int:
+    """Apply events; if ``latencies`` is given, time each one into it by kind"""
+    trades = 0
+    clock = time.perf_counter_ns
+    for event in events:
+        if event[0] == "add":
+            order = Order(event[1], price=event[3], quantity=event[4], side=event[2])
+            start = clock()
+            book.add_order(order)
+            trades += len(engine.match_orders())
+        else:
+            start = clock()
+            book.cancel_order(event[1])
+        if latencies is not None:
+            latencies[event[0]].append(clock() - start)
+    return trades
+
+
+def _percentiles(samples: List[int]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    samples = sorted(samples)
+    last = len(samples) - 1
+    return {f"p{p:g}": samples[min(last, int(round(p / 100 * last)))] / 1000
+            for p in PERCENTILES}
+
+
+def _fresh_engine(workload: Workload):
+    book = OrderBook(DepthIndex() if workload.depth_index else None)
+    engine = MatchingEngine(book, log_trades=False)
+    _replay(book, engine, workload.setup)
+    return book, engine
+
+
+def run_scenario(workload: Workload, repeat: int = 3) -> dict:
+    """Best-of-``repeat`` throughput, latencies from one pass, and peak memory"""
+    best = None
+    trades = 0
+    for _ in range(repeat):
+        book, engine = _fresh_engine(workload)
+        gc.collect()
+        started = time.perf_counter()
+        trades = _replay(book, engine, workload.events)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    book, engine = _fresh_engine(workload)
+    latencies = {"add": [], "cancel": []}
+    _replay(book, engine, workload.events, latencies)
+
+    book, engine = _fresh_engine(workload)
+    gc.collect()
+    tracemalloc.start()
+    _replay(book, engine, workload.events)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "events": len(workload.events),
+        "trades": trades,
+        "seconds": best,
+        "events_per_second": len(workload.events) / best if best else float("inf"),
+        # Latencies in microseconds; "add" includes matching the new order
+        "latency_us": {kind: _percentiles(samples) for kind, samples in latencies.items()},
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_suite(scale: float = 1.0, names=None, repeat: int = 3) -> dict:
+    return {
+        "python": platform.python_version(),
+        "scale": scale,
+        "scenarios": {w.name: run_scenario(w, repeat) for w in build_workloads(scale, names)},
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10,
+            memory_threshold: Optional[float] = None) -> List[str]:
+    """
+    Human-readable regressions of ``current`` against ``baseline``.
+
+    Peak memory is gated on ``memory_threshold``, which defaults to
+    ``threshold``.
+    """
+    if memory_threshold is None:
+        memory_threshold = threshold
+    regressions = []
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+
+        old_rate, new_rate = before["events_per_second"], result["events_per_second"]
+        if new_rate < old_rate * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {new_rate:,.0f}/s vs {old_rate:,.0f}/s "
+                f"({new_rate / old_rate - 1:+.1%})")
+
+        for kind, stats in result["latency_us"].items():
+            old_p99 = before.get("latency_us", {}).get(kind, {}).get("p99")
+            new_p99 = stats.get("p99")
+            if old_p99 and new_p99 and new_p99 > old_p99 * (1 + threshold):
+                regressions.append(
+                    f"{name}: {kind} p99 {new_p99:.2f}us vs {old_p99:.2f}us "
+                    f"({new_p99 / old_p99 - 1:+.1%})")
+
+        old_peak = before.get("peak_memory_bytes")
+        new_peak = result.get("peak_memory_bytes")
+        if old_peak and new_peak and new_peak > old_peak * (1 + memory_threshold):
+            regressions.append(
+                f"{name}: peak memory {new_peak:,} B vs {old_peak:,} B "
+                f"({new_peak / old_peak - 1:+.1%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiplier on the number of events per scenario")
+    parser.add_argument("--scenario", action="append", dest="scenarios",
+                        help="Run only this scenario (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write results JSON here instead of stdout")
+    parser.add_argument("--compare", help="Baseline results JSON to gate against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed fractional regression (default 0.10)")
+    parser.add_argument("--memory-threshold", type=float, default=None,
+                        help="Allowed fractional peak memory growth (default: --threshold)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.scale, args.scenarios, args.repeat)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold, args.memory_threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Seeded synthetic order-flow generators for the core engine benchmarks.
+
+A workload is a list of plain tuples so generating it is kept out of the
+timed loop:
+
+    ("add", order_id, side, price, quantity)
+    ("cancel", order_id)
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+from src.core.order import OrderSide
+
+Event = Tuple
+
+
+@dataclass
+class Workload:
+    name: str
+    setup: List[Event] = field(default_factory=list)  # applied before timing
+    events: List[Event] = field(default_factory=list)  # timed
+    depth_index: bool = False  # maintain a DepthIndex alongside the book
+
+
+def poisson_flow(count: int, seed: int = 0, cancel_ratio: float = 0.7, spread_ticks: int = 2,
+                 depth_ticks: int = 20, marketable_ratio: float = 0.05,
+                 mean_size: int = 100, tick_size: float = 0.01,
+                 start_price: float = 100.0, prefix: str = "") -> List[Event]:
+    """
+    Limit order flow with Poisson arrivals around a drifting mid.
+
+    Adds and cancels are independent Poisson streams with ``cancel_ratio``
+    cancels per add, so merged, each event is a cancel of a random live
+    order with probability ``cancel_ratio / (1 + cancel_ratio)``.
+    The replay runs flat out, so only the order of events is generated,
+    not their times. Passive orders land a geometric number of ticks
+    behind the touch, up to ``depth_ticks``; ``marketable_ratio`` of
+    arrivals cross the spread.
+    """
+    rng = random.Random(seed)
+    mid = round(start_price / tick_size)
+    live: List[str] = []
+    events: List[Event] = []
+    next_id = 0
+    p_cancel = cancel_ratio / (1 + cancel_ratio)
+
+    for _ in range(count):
+        if rng.random() < 0.01:
+            mid += 1 if rng.random() < 0.5 else -1
+
+        if live and rng.random() < p_cancel:
+            # Swap-remove keeps picking a random live order O(1)
+            i = rng.randrange(len(live))
+            live[i], live[-1] = live[-1], live[i]
+            events.append(("cancel", live.pop()))
+            continue
+
+        side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+        if rng.random() < marketable_ratio:
+            offset = -spread_ticks  # through the touch
+        else:
+            offset = min(int(rng.expovariate(0.3)), depth_ticks)
+        half = spread_ticks // 2 + offset
+        tick = mid - half if side == OrderSide.BUY else mid + half
+        qty = max(1, int(rng.expovariate(1 / mean_size)))
+
+        order_id = f"{prefix}{next_id}"
+        next_id += 1
+        events.append(("add", order_id, side, round(tick * tick_size, 10), qty))
+        live.append(order_id)
+
+    return events
+
+
+def ladder(levels: int, orders_per_level: int, seed: int = 0, size: int = 100,
+           tick_size: float = 0.01, start_price: float = 100.0,
+           prefix: str = "L") -> List[Event]:
+    """Resting bids and asks, ``orders_per_level`` deep on every level"""
+    rng = random.Random(seed)
+    mid = round(start_price / tick_size)
+    events = []
+    for level in range(levels):
+        for side, tick in ((OrderSide.BUY, mid - 1 - level),
+                           (OrderSide.SELL, mid + 1 + level)):
+            for k in range(orders_per_level):
+                qty = rng.randint(1, 2 * size)
+                events.append(("add", f"{prefix}{side.value[0]}{level}-{k}", side,
+                               round(tick * tick_size, 10), qty))
+    return events
+
+
+def sweeps(count: int, levels: int, seed: int = 0, size: int = 100,
+           tick_size: float = 0.01, start_price: float = 100.0) -> List[Event]:
+    """
+    Aggressors that each sweep several levels, interleaved with refills.
+
+    Each sweep is followed by a ladder refill so the book stays deep.
+    """
+    rng = random.Random(seed)
+    mid = round(start_price / tick_size)
+    events = []
+    for i in range(count):
+        side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+        reach = rng.randint(1, levels)
+        tick = mid + reach if side == OrderSide.BUY else mid - reach
+        events.append(("add", f"SW{i}", side, round(tick * tick_size, 10),
+                       reach * size * 2))
+        events.extend(ladder(reach, 2, seed=seed + i, size=size,
+                             tick_size=tick_size, start_price=start_price,
+                             prefix=f"R{i}-"))
+    return events
+
+
+def touch_churn(count: int, size: int = 100, tick_size: float = 0.01,
+                start_price: float = 100.0) -> List[Event]:
+    """
+    A resting order at the touch that is repeatedly added and filled.
+
+    Each cycle leaves the ask side holding only whatever was set up
+    beforehand, e.g. a stale order far from the market.
+    """
+    price = round(round(start_price / tick_size) * tick_size, 10)
+    events = []
+    for i in range(count):
+        events.append(("add", f"CS{i}", OrderSide.SELL, price, size))
+        events.append(("add", f"CB{i}", OrderSide.BUY, price, size))
+    return events
+
+
+def _scenarios(scale: float) -> Dict[str, Callable[[], Workload]]:
+    n = max(1, int(100_000 * scale))
+    return {
+        "poisson_shallow": lambda: Workload(
+            "poisson_shallow",
+            setup=ladder(3, 5),
+            events=poisson_flow(n, seed=1, depth_ticks=3)),
+        "poisson_deep": lambda: Workload(
+            "poisson_deep",
+            setup=ladder(500, 20),
+            events=poisson_flow(n, seed=2, depth_ticks=500)),
+        "poisson_deep_indexed": lambda: Workload(
+            "poisson_deep_indexed",
+            setup=ladder(500, 20),
+            events=poisson_flow(n, seed=2, depth_ticks=500),
+            depth_index=True),
+        "low_cancel": lambda: Workload(
+            "low_cancel",
+            setup=ladder(20, 10),
+            events=poisson_flow(n, seed=3, cancel_ratio=0.2)),
+        "high_cancel": lambda: Workload(
+            "high_cancel",
+            setup=ladder(20, 10),
+            events=poisson_flow(n, seed=4, cancel_ratio=0.95)),
+        "sweeping_aggressors": lambda: Workload(
+            "sweeping_aggressors",
+            setup=ladder(50, 4),
+            events=sweeps(max(1, n // 20), levels=10, seed=5)),
+        "stale_outlier_indexed": lambda: Workload(
+            "stale_outlier_indexed",
+            setup=[("add", "STALE", OrderSide.SELL, 10_000.0, 1)],
+            events=touch_churn(max(1, n // 2)),
+            depth_index=True),
+    }
+
+
+def build_workloads(scale: float = 1.0, names=None) -> List[Workload]:
+    scenarios = _scenarios(scale)
+    unknown = set(names or ()) - set(scenarios)
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    return [factory() for name, factory in scenarios.items()
+            if not names or name in names]
@@ -0,0 +1,42 @@
+from typing import Callable, Optional
+
+from ..core.bars import Bar, BarBuilder, BarSpec
+from .strategies import TradingStrategy
+
+
+class BarStrategyFeed:
+    """
+    Runs a strategy on every closed bar of one spec from a BarBuilder.
+
+    Each bar re-evaluates the strategy over the trailing ``window`` bars
+    (by default just enough for its lookback). As in the backtests, a zero
+    signal keeps the previous position.
+    """
+
+    def __init__(self, builder: BarBuilder, spec: BarSpec, strategy: TradingStrategy,
+                 on_signal: Optional[Callable[[Bar, int, float], None]] = None,
+                 window: Optional[int] = None):
+        if spec not in builder.series:
+            raise ValueError(f"Bar builder has no '{spec}' bars")
+        self.builder = builder
+        self.spec = spec
+        self.strategy = strategy
+        self.on_signal = on_signal
+        self.window = window or strategy.lookback + 1
+        if self.window > builder.series[spec].capacity:
+            raise ValueError(
+                f"Window of {self.window} bars exceeds the ring buffer capacity")
+        self.signal = 0
+        self.position = 0.0
+        builder.subscribe(self._on_bar)
+
+    def _on_bar(self, spec: BarSpec, bar: Bar) -> None:
+        if spec != self.spec:
+            return
+        frame = self.builder.series[spec].to_frame(self.window)
+        results = self.strategy.generate_signals(frame)
+        self.signal = int(results['Signal'].iloc[-1])
+        if self.signal:
+            self.position = float(self.signal)
+        if self.on_signal is not None:
+            self.on_signal(bar, self.signal, self.position)
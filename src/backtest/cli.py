@@ -0,0 +1,154 @@
+"""
+Headless batch backtest runner.
+
+    python -m src.backtest job.json [--output-dir results]
+
+Only the standard library is imported at start-up; pandas, NumPy and the
+strategies are loaded when the first run executes, and nothing from the
+UI or network libraries is ever imported.
+"""
+import argparse
+import itertools
+import json
+import logging
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..utils.logger import LoggerSetup
+
+logger = logging.getLogger(__name__)
+
+
+def load_job(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        job = json.load(f)
+    if not job.get("runs"):
+        raise ValueError(f"Job file {path} has no runs")
+    return job
+
+
+def expand_runs(job: dict) -> List[dict]:
+    """
+    Flatten the job into concrete runs.
+
+    Each run inherits ``defaults``; a ``grid`` of parameter lists expands
+    into one run per combination, merged over ``params``.
+    """
+    runs = []
+    defaults = job.get("defaults", {})
+    for i, spec in enumerate(job["runs"]):
+        spec = {**defaults, **spec}
+        base_name = spec.get("name", f"run{i}")
+        grid = spec.pop("grid", None) or {}
+        keys = list(grid)
+        combos = list(itertools.product(*(grid[k] for k in keys))) or [()]
+        for j, values in enumerate(combos):
+            run = dict(spec)
+            run["params"] = {**spec.get("params", {}), **dict(zip(keys, values))}
+            run["name"] = base_name if len(combos) == 1 else f"{base_name}-{j}"
+            runs.append(run)
+    return runs
+
+
+def execute_run(run: dict, base_dir: Path, output_dir: Path) -> Dict[str, float]:
+    """Run one backtest, write its results CSV and return its metrics"""
+    import pandas as pd
+    from .metrics import compute_metrics
+    from .strategies import get_strategy
+    from .streaming import ChunkedBacktest
+
+    missing = [key for key in ("strategy", "data") if key not in run]
+    if missing:
+        raise ValueError(f"Run has no {' or '.join(missing)}")
+    strategy = get_strategy(run["strategy"], **run.get("params", {}))
+    source = base_dir / run["data"]
+    output = output_dir / f"{run['name']}.csv"
+    periods_per_year = run.get("periods_per_year", 252)
+
+    if run.get("chunksize"):
+        if run.get("simulate"):
+            raise ValueError("Order book simulation needs the full history; drop chunksize")
+        return ChunkedBacktest(strategy).run_file(
+            source, output, chunksize=run["chunksize"],
+            column_map=run.get("column_map"), periods_per_year=periods_per_year)
+
+    data = pd.read_csv(source, index_col=0, parse_dates=True)
+    if run.get("column_map"):
+        data = data.rename(columns=run["column_map"])
+    results = strategy.generate_signals(data)
+
+    if run.get("simulate"):
+        from .simulator import BookSimulator, SyntheticLiquidity
+        simulator = BookSimulator(SyntheticLiquidity(**run.get("liquidity", {})),
+                                  **run.get("simulator", {}))
+        results = simulator.run(results).data
+
+    results.to_csv(output)
+    # Simulated runs are measured on what was actually held, not the target
+    held = "Held_Position" if "Held_Position" in results else "Position"
+    metrics = compute_metrics(results["Strategy_Returns"].to_numpy(),
+                              positions=results[held].to_numpy(),
+                              periods_per_year=periods_per_year)
+    summary = {name: value[0].item() for name, value in metrics.items()}
+    summary["rows"] = len(results)
+    return summary
+
+
+def run_job(job_path: Path, output_dir: Optional[Path] = None) -> List[dict]:
+    """Execute every run of a job file and write ``summary.json``"""
+    job = load_job(job_path)
+    base_dir = job_path.parent
+    output_dir = output_dir or base_dir / job.get("output_dir", "results")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    summaries = []
+    for run in expand_runs(job):
+        started = time.perf_counter()
+        entry = {"name": run["name"], "strategy": run.get("strategy"),
+                 "params": run.get("params", {})}
+        try:
+            entry["metrics"] = execute_run(run, base_dir, output_dir)
+            entry["status"] = "ok"
+        except Exception as e:
+            logger.error(f"Run {run['name']} failed: {e}")
+            entry["status"] = "error"
+            entry["error"] = str(e)
+        entry["seconds"] = round(time.perf_counter() - started, 3)
+        logger.info(f"Run {run['name']} {entry['status']} in {entry['seconds']}s")
+        summaries.append(entry)
+
+    with open(output_dir / "summary.json", "w", encoding="utf-8") as f:
+        # NaN is not valid JSON; report undefined metrics as null
+        json.dump(_without_nan(summaries), f, indent=2)
+    return summaries
+
+
+def _without_nan(value):
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _without_nan(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_without_nan(v) for v in value]
+    return value
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.backtest", description="Run backtests from a job file")
+    parser.add_argument("job", type=Path, help="JSON job file")
+    parser.add_argument("--output-dir", type=Path, default=None,
+                        help="Where to write results (default: job's output_dir)")
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args(argv)
+
+    LoggerSetup.setup(level=args.log_level)
+    summaries = run_job(args.job, args.output_dir)
+    return 0 if all(s["status"] == "ok" for s in summaries) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
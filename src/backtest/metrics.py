@@ -0,0 +1,237 @@
+"""
+Vectorized performance metrics for many backtest runs at once.
+
+Every function takes a 2-D array shaped ``(runs, time)`` (a 1-D array is
+treated as a single run) and returns one value per run, or for the
+rolling variants one row per run. NaN returns, such as the first row of
+``Strategy_Returns``, count as flat periods for the equity curve and are
+ignored by the averages.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def _as_2d(values) -> np.ndarray:
+    array = np.asarray(values, dtype=float)
+    if array.ndim == 1:
+        array = array[np.newaxis, :]
+    if array.ndim != 2:
+        raise ValueError(f"Expected a (runs, time) array, got shape {array.shape}")
+    return array
+
+
+def equity_curve(returns) -> np.ndarray:
+    """Compounded equity for each run, starting from 1"""
+    returns = _as_2d(returns)
+    return np.cumprod(1 + np.nan_to_num(returns), axis=1)
+
+
+def total_return(returns) -> np.ndarray:
+    returns = _as_2d(returns)
+    return np.prod(1 + np.nan_to_num(returns), axis=1) - 1
+
+
+def sharpe_ratio(returns, periods_per_year: int = 252) -> np.ndarray:
+    returns = _as_2d(returns)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (np.nanmean(returns, axis=1) / np.nanstd(returns, axis=1, ddof=1)
+                * np.sqrt(periods_per_year))
+
+
+def sortino_ratio(returns, periods_per_year: int = 252) -> np.ndarray:
+    returns = _as_2d(returns)
+    downside = np.minimum(returns, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        downside_dev = np.sqrt(np.nanmean(downside ** 2, axis=1))
+        return np.nanmean(returns, axis=1) / downside_dev * np.sqrt(periods_per_year)
+
+
+def drawdowns(returns) -> np.ndarray:
+    """Fractional distance below the running peak at every period"""
+    equity = equity_curve(returns)
+    # The starting capital counts as the first peak
+    peak = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+    return equity / peak - 1
+
+
+def max_drawdown(returns) -> np.ndarray:
+    return drawdowns(returns).min(axis=1, initial=0)
+
+
+def _longest_underwater(dd: np.ndarray) -> np.ndarray:
+    underwater = dd < 0
+    steps = np.arange(underwater.shape[1])
+    # Index of the most recent period at a peak; -1 if never at one
+    last_peak = np.maximum.accumulate(np.where(underwater, -1, steps), axis=1)
+    return (steps - last_peak).max(axis=1, initial=0)
+
+
+def drawdown_duration(returns) -> np.ndarray:
+    """Longest run of consecutive periods spent below a previous peak"""
+    return _longest_underwater(drawdowns(returns))
+
+
+def turnover(positions) -> np.ndarray:
+    """Average absolute change in position per period"""
+    positions = np.nan_to_num(_as_2d(positions))
+    if positions.shape[1] < 2:
+        return np.zeros(positions.shape[0])
+    return np.abs(np.diff(positions, axis=1)).mean(axis=1)
+
+
+def hit_rate(returns) -> np.ndarray:
+    """Share of periods with a non-zero return that were profitable"""
+    returns = _as_2d(returns)
+    active = np.nan_to_num(returns) != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (returns > 0).sum(axis=1) / active.sum(axis=1)
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window sums along time; the first window - 1 columns are NaN"""
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    csum = np.cumsum(values, axis=1)
+    out = np.full(values.shape, np.nan)
+    if window <= values.shape[1]:
+        out[:, window - 1:] = csum[:, window - 1:]
+        out[:, window:] -= csum[:, :-window]
+    return out
+
+
+def rolling_return(returns, window: int) -> np.ndarray:
+    log_growth = np.log1p(np.nan_to_num(_as_2d(returns)))
+    return np.expm1(_rolling_sum(log_growth, window))
+
+
+def rolling_sharpe(returns, window: int, periods_per_year: int = 252) -> np.ndarray:
+    returns = _as_2d(returns)
+    valid = ~np.isnan(returns)
+    clean = np.where(valid, returns, 0.0)
+    count = _rolling_sum(valid.astype(float), window)
+    total = _rolling_sum(clean, window)
+    total_sq = _rolling_sum(clean ** 2, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        variance = (total_sq - count * mean ** 2) / (count - 1)
+        return mean / np.sqrt(np.maximum(variance, 0)) * np.sqrt(periods_per_year)
+
+
+def rolling_sortino(returns, window: int, periods_per_year: int = 252) -> np.ndarray:
+    returns = _as_2d(returns)
+    valid = ~np.isnan(returns)
+    clean = np.where(valid, returns, 0.0)
+    count = _rolling_sum(valid.astype(float), window)
+    total = _rolling_sum(clean, window)
+    downside_sq = _rolling_sum(np.minimum(clean, 0) ** 2, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (total / count) / np.sqrt(downside_sq / count) * np.sqrt(periods_per_year)
+
+
+def compute_metrics(returns, positions: Optional[np.ndarray] = None,
+                    periods_per_year: int = 252) -> Dict[str, np.ndarray]:
+    """All summary metrics for every run in one pass over the arrays"""
+    returns = _as_2d(returns)
+    dd = drawdowns(returns)
+
+    metrics = {
+        "total_return": total_return(returns),
+        "sharpe_ratio": sharpe_ratio(returns, periods_per_year),
+        "sortino_ratio": sortino_ratio(returns, periods_per_year),
+        "max_drawdown": dd.min(axis=1, initial=0),
+        "drawdown_duration": _longest_underwater(dd),
+        "hit_rate": hit_rate(returns),
+    }
+    if positions is not None:
+        metrics["turnover"] = turnover(positions)
+    return metrics
+
+
+class MetricsAccumulator:
+    """
+    The ``compute_metrics`` summary of one run, fed a chunk at a time.
+
+    Only running sums and the equity, peak and underwater state are kept,
+    so memory does not grow with the history; ``result`` matches
+    ``compute_metrics`` over the concatenated chunks.
+    """
+
+    def __init__(self, periods_per_year: int = 252):
+        self.periods_per_year = periods_per_year
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.downside_sq = 0.0
+        self.wins = 0
+        self.active = 0
+        self.equity = 1.0
+        self.peak = 1.0
+        self.max_drawdown = 0.0
+        self.steps = 0
+        self.last_peak_step = -1
+        self.longest_underwater = 0
+        self.position_count = 0
+        self.position_change = 0.0
+        self.last_position: Optional[float] = None
+
+    def update(self, returns, positions: Optional[np.ndarray] = None) -> None:
+        returns = np.asarray(returns, dtype=float)
+        valid = returns[~np.isnan(returns)]
+        self.count += len(valid)
+        self.total += valid.sum()
+        self.total_sq += (valid ** 2).sum()
+        self.downside_sq += (np.minimum(valid, 0) ** 2).sum()
+        self.wins += int((valid > 0).sum())
+        self.active += int((valid != 0).sum())
+
+        if len(returns):
+            equity = self.equity * np.cumprod(1 + np.nan_to_num(returns))
+            peak = np.maximum(np.maximum.accumulate(equity), self.peak)
+            dd = equity / peak - 1
+            steps = self.steps + np.arange(len(returns))
+            last_peak = np.maximum(
+                np.maximum.accumulate(np.where(dd < 0, -1, steps)), self.last_peak_step)
+            self.max_drawdown = min(self.max_drawdown, dd.min())
+            self.longest_underwater = max(self.longest_underwater,
+                                          int((steps - last_peak).max()))
+            self.equity = equity[-1]
+            self.peak = peak[-1]
+            self.last_peak_step = int(last_peak[-1])
+            self.steps += len(returns)
+
+        if positions is not None and len(positions):
+            positions = np.nan_to_num(np.asarray(positions, dtype=float))
+            if self.last_position is not None:
+                positions = np.concatenate([[self.last_position], positions])
+                self.position_count -= 1
+            self.position_change += np.abs(np.diff(positions)).sum()
+            self.position_count += len(positions)
+            self.last_position = positions[-1]
+
+    def result(self) -> Dict[str, float]:
+        count = np.float64(self.count)
+        scale = np.sqrt(self.periods_per_year)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = self.total / count
+            variance = (self.total_sq - count * mean ** 2) / (count - 1)
+            metrics = {
+                "total_return": float(self.equity - 1),
+                "sharpe_ratio": float(mean / np.sqrt(max(variance, 0)) * scale),
+                "sortino_ratio": float(mean / np.sqrt(self.downside_sq / count) * scale),
+                "max_drawdown": float(self.max_drawdown),
+                "drawdown_duration": self.longest_underwater,
+                "hit_rate": float(self.wins / np.float64(self.active)),
+            }
+        if self.last_position is not None:
+            metrics["turnover"] = (float(self.position_change / (self.position_count - 1))
+                                   if self.position_count > 1 else 0.0)
+        return metrics
+
+
+def rank_runs(metrics: Dict[str, np.ndarray], by: str = "sharpe_ratio",
+              ascending: bool = False) -> np.ndarray:
+    """Run indices ordered by one metric, NaNs last"""
+    values = np.asarray(metrics[by], dtype=float)
+    key = values if ascending else -values
+    return np.argsort(np.where(np.isnan(key), np.inf, key), kind="stable")
@@ -0,0 +1,148 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .metrics import compute_metrics
+
+
+@dataclass
+class RobustnessResult:
+    """Per-path metric distributions from a resampling run"""
+    method: str
+    n_paths: int
+    metrics: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def confidence_interval(self, name: str, level: float = 0.95) -> Tuple[float, float]:
+        """Percentile interval of one metric, ignoring undefined paths"""
+        tail = (1 - level) / 2 * 100
+        lower, upper = np.nanpercentile(self.metrics[name], [tail, 100 - tail])
+        return float(lower), float(upper)
+
+    def summary(self, level: float = 0.95) -> Dict[str, Dict[str, float]]:
+        out = {}
+        for name, values in self.metrics.items():
+            lower, upper = self.confidence_interval(name, level)
+            out[name] = {
+                "mean": float(np.nanmean(values)),
+                "median": float(np.nanmedian(values)),
+                "lower": lower,
+                "upper": upper,
+            }
+        return out
+
+
+def _run_paths(method: str, n_paths: int, chunk_size: int,
+               make_chunk: Callable[[int], Tuple[np.ndarray, Optional[np.ndarray]]],
+               periods_per_year: int) -> RobustnessResult:
+    """
+    Generate paths ``chunk_size`` at a time so memory stays bounded.
+
+    ``make_chunk`` must take a fixed number of draws per path from one
+    stream, so the paths (and results) for a seed do not depend on
+    ``chunk_size``.
+    """
+    result = RobustnessResult(method, n_paths)
+    for start in range(0, n_paths, chunk_size):
+        count = min(chunk_size, n_paths - start)
+        returns, positions = make_chunk(count)
+        chunk = compute_metrics(returns, positions, periods_per_year)
+        for name, values in chunk.items():
+            if name not in result.metrics:
+                result.metrics[name] = np.empty(n_paths, dtype=float)
+            result.metrics[name][start:start + count] = values
+    return result
+
+
+def _uniform_ints(rng: np.random.Generator, high: int, size: Tuple[int, int]) -> np.ndarray:
+    """Integers in [0, high) from exactly one 64-bit draw each, unlike ``rng.integers``"""
+    return np.minimum((rng.random(size) * high).astype(np.int64), high - 1)
+
+
+def block_bootstrap_paths(returns: np.ndarray, n_paths: int, block_size: int,
+                          rng: np.random.Generator) -> np.ndarray:
+    """
+    Circular block bootstrap of a return series into ``(n_paths, len)``.
+
+    Whole blocks of consecutive returns are drawn with replacement, so
+    autocorrelation within a block survives the resampling. Each path
+    takes a fixed number of uniform draws, so generating paths in several
+    calls gives the same paths as one call.
+    """
+    length = len(returns)
+    block_size = max(1, min(block_size, length))
+    blocks = -(-length // block_size)
+    starts = _uniform_ints(rng, length, (n_paths, blocks))
+    index = (starts[:, :, np.newaxis] + np.arange(block_size)) % length
+    return returns[index.reshape(n_paths, -1)[:, :length]]
+
+
+def bootstrap(strategy_returns, n_paths: int = 10_000, block_size: int = 20,
+              chunk_size: int = 1_000, seed: Optional[int] = None,
+              periods_per_year: int = 252) -> RobustnessResult:
+    """Metric distributions over block-bootstrapped ``Strategy_Returns``"""
+    returns = np.asarray(strategy_returns, dtype=float)
+    returns = returns[~np.isnan(returns)]
+    if len(returns) == 0:
+        raise ValueError("No strategy returns to resample")
+    rng = np.random.default_rng(seed)
+
+    def make_chunk(count):
+        return block_bootstrap_paths(returns, count, block_size, rng), None
+
+    return _run_paths("block_bootstrap", n_paths, chunk_size, make_chunk, periods_per_year)
+
+
+def perturbed_positions(positions: np.ndarray, n_paths: int, max_delay: int,
+                        rng: np.random.Generator) -> np.ndarray:
+    """
+    Delay every position change by an independent random 0..max_delay bars.
+
+    Changes keep their order: a change that would land before the previous
+    delayed change happens together with it instead.
+    """
+    positions = np.nan_to_num(np.asarray(positions, dtype=float))
+    length = len(positions)
+    changes = np.flatnonzero(np.diff(positions)) + 1
+    if len(changes) == 0:
+        return np.broadcast_to(positions, (n_paths, length)).copy()
+
+    delayed = changes + _uniform_ints(rng, max_delay + 1, (n_paths, len(changes)))
+    delayed = np.minimum(np.maximum.accumulate(delayed, axis=1), length)
+
+    # How many changes have taken effect by each bar, per path
+    counts = np.zeros((n_paths, length + 1), dtype=np.int64)
+    rows = np.repeat(np.arange(n_paths), len(changes))
+    np.add.at(counts, (rows, delayed.ravel()), 1)
+    active = np.cumsum(counts[:, :length], axis=1)
+
+    levels = np.concatenate([[positions[0]], positions[changes]])
+    return levels[active]
+
+
+def entry_perturbation(positions, asset_returns, n_paths: int = 10_000,
+                       max_delay: int = 3, chunk_size: int = 1_000,
+                       seed: Optional[int] = None,
+                       periods_per_year: int = 252) -> RobustnessResult:
+    """
+    Metric distributions when entries and exits are randomly late.
+
+    ``positions`` and ``asset_returns`` are the backtest's ``Position`` and
+    ``Returns`` columns; as in the backtest, each bar earns the previous
+    bar's position.
+    """
+    positions = np.asarray(positions, dtype=float)
+    asset_returns = np.nan_to_num(np.asarray(asset_returns, dtype=float))
+    if positions.shape != asset_returns.shape:
+        raise ValueError("positions and asset_returns must be the same length")
+    rng = np.random.default_rng(seed)
+
+    def make_chunk(count):
+        paths = perturbed_positions(positions, count, max_delay, rng)
+        returns = np.empty(paths.shape)
+        returns[:, 0] = np.nan
+        returns[:, 1:] = paths[:, :-1] * asset_returns[1:]
+        return returns, paths
+
+    return _run_paths("entry_perturbation", n_paths, chunk_size, make_chunk,
+                      periods_per_year)
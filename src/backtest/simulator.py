@@ -0,0 +1,269 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+import random
+
+import numpy as np
+import pandas as pd
+
+from ..core.order import Order, OrderSide
+from ..core.order_book import OrderBook
+from ..core.matching_engine import MatchingEngine, Trade
+
+
+class BookEvent(NamedTuple):
+    """A single add or cancel applied to the simulated book"""
+    action: str  # "add" or "cancel"
+    order_id: str
+    side: Optional[OrderSide] = None
+    price: float = 0.0
+    quantity: int = 0
+
+
+@dataclass
+class Fill:
+    step: int
+    order_id: str
+    side: OrderSide
+    price: float
+    quantity: int
+
+
+@dataclass
+class SimulationResult:
+    data: pd.DataFrame
+    fills: List[Fill] = field(default_factory=list)
+    events: int = 0
+
+
+class LiquidityModel(ABC):
+    """Source of non-strategy order flow for the simulator"""
+
+    @abstractmethod
+    def quotes(self, step: int, price: float) -> Iterable[BookEvent]:
+        """Resting liquidity applied before the strategy acts"""
+        pass
+
+    def flow(self, step: int, price: float) -> Iterable[BookEvent]:
+        """Marketable flow applied after the strategy acts (immediate-or-cancel)"""
+        return ()
+
+    def reset(self) -> None:
+        """Forget any state carried from a previous run"""
+        pass
+
+
+class SyntheticLiquidity(LiquidityModel):
+    """Ladder of maker quotes around the reference price plus random takers"""
+
+    def __init__(self, levels: int = 5, depth: int = 100, tick_size: float = 0.01,
+                 spread_ticks: int = 1, taker_rate: float = 0.0,
+                 taker_size: int = 50, seed: Optional[int] = None):
+        self.levels = levels
+        self.depth = depth
+        self.tick_size = tick_size
+        self.spread_ticks = spread_ticks
+        self.taker_rate = taker_rate
+        self.taker_size = taker_size
+        self.seed = seed
+        self.reset()
+
+    def reset(self) -> None:
+        self._rng = random.Random(self.seed)
+        self._resting: List[str] = []
+
+    def quotes(self, step: int, price: float) -> List[BookEvent]:
+        events = [BookEvent("cancel", order_id) for order_id in self._resting]
+        self._resting = []
+
+        rand = self._rng.random
+        size = 2 * self.depth
+        tick = self.tick_size
+        best_bid = round(price / tick) - self.spread_ticks // 2
+        for i in range(self.levels):
+            bid = (best_bid - i) * tick
+            ask = (best_bid + self.spread_ticks + i) * tick
+            for side, px in ((OrderSide.BUY, bid), (OrderSide.SELL, ask)):
+                order_id = f"LQ{step}-{side.value[0]}{i}"
+                qty = int(rand() * size) + 1
+                events.append(BookEvent("add", order_id, side, round(px, 10), qty))
+                self._resting.append(order_id)
+        return events
+
+    def flow(self, step: int, price: float) -> List[BookEvent]:
+        if self.taker_rate <= 0:
+            return []
+
+        rng = self._rng
+        # Poisson arrival count via exponential inter-arrival times
+        count, t = 0, rng.expovariate(self.taker_rate)
+        while t < 1.0:
+            count += 1
+            t += rng.expovariate(self.taker_rate)
+
+        reach = (self.levels + self.spread_ticks) * self.tick_size
+        events = []
+        for i in range(count):
+            side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+            px = price + reach if side == OrderSide.BUY else price - reach
+            qty = int(rng.random() * 2 * self.taker_size) + 1
+            events.append(BookEvent("add", f"TK{step}-{i}", side, round(px, 10), qty))
+        return events
+
+
+class ReplayLiquidity(LiquidityModel):
+    """Replays recorded book events keyed by step"""
+
+    def __init__(self, quotes: Mapping[int, Sequence[BookEvent]],
+                 flow: Optional[Mapping[int, Sequence[BookEvent]]] = None):
+        self._quotes = quotes
+        self._flow = flow or {}
+
+    def quotes(self, step: int, price: float) -> Sequence[BookEvent]:
+        return self._quotes.get(step, ())
+
+    def flow(self, step: int, price: float) -> Sequence[BookEvent]:
+        return self._flow.get(step, ())
+
+
+class BookSimulator:
+    """
+    Execute strategy positions as orders through OrderBook/MatchingEngine.
+
+    The target for each bar is the previous bar's ``Position`` (a signal
+    known at the close is traded on the next bar), executed against the
+    liquidity model at the bar's ``Open`` (``Close`` if there is no open).
+    Equity is marked at the close. ``Holdings`` is the share count actually
+    held and ``Held_Position`` the same in units of ``Position`` (shares
+    over ``order_size``), so turnover can be measured on real fills.
+    """
+
+    def __init__(self, liquidity: LiquidityModel, order_size: int = 100,
+                 capital: float = 100_000.0, tick_size: float = 0.01,
+                 execution: str = "aggressive", slippage_ticks: int = 5):
+        if execution not in ("aggressive", "passive"):
+            raise ValueError(f"Unknown execution style '{execution}'")
+        self.liquidity = liquidity
+        self.order_size = order_size
+        self.capital = capital
+        self.tick_size = tick_size
+        self.execution = execution
+        self.slippage_ticks = slippage_ticks
+
+    def run(self, data: pd.DataFrame) -> SimulationResult:
+        if 'Position' not in data:
+            raise ValueError("Data has no 'Position' column; generate signals first")
+
+        book = OrderBook()
+        engine = MatchingEngine(book, log_trades=False)
+        self.liquidity.reset()
+
+        close = data['Close'].to_numpy(dtype=float)
+        # Plain Python floats; numpy scalars are several times slower per op
+        ref = (data['Open'] if 'Open' in data else data['Close']).astype(float).tolist()
+        signal = data['Position'].fillna(0).astype(float).tolist()
+        n = len(data)
+
+        holdings = np.zeros(n)
+        filled = np.zeros(n)
+        fill_notional = np.zeros(n)
+        cash = np.zeros(n)
+
+        fills: List[Fill] = []
+        mine: Dict[str, Order] = {}
+        working: Optional[Order] = None
+        position = 0
+        balance = self.capital
+        events = 0
+        sequence = 0
+
+        for step in range(n):
+            price = ref[step]
+            target = int(round(signal[step - 1] * self.order_size)) if step else 0
+
+            trades = []
+            for event in self.liquidity.quotes(step, price):
+                trades.extend(self._apply(book, engine, event))
+                events += 1
+
+            # A resting order keeps its queue position while it still fits the target
+            wanted = target - position
+            if working is not None and working.order_id in book.orders:
+                pending = working.remaining_quantity
+                if working.side == OrderSide.SELL:
+                    pending = -pending
+                if pending != wanted:
+                    book.cancel_order(working.order_id)
+                    working = None
+            else:
+                working = None
+
+            if wanted and working is None:
+                side = OrderSide.BUY if wanted > 0 else OrderSide.SELL
+                px = self._order_price(book, side, price)
+                sequence += 1
+                working = Order(f"SIM{sequence}", price=px, quantity=abs(wanted), side=side)
+                mine[working.order_id] = working
+                book.add_order(working)
+                trades.extend(engine.match_orders())
+                events += 1
+
+            for event in self.liquidity.flow(step, price):
+                trades.extend(self._apply(book, engine, event))
+                book.cancel_order(event.order_id)
+                events += 1
+
+            if working is not None and self.execution == "aggressive":
+                book.cancel_order(working.order_id)
+                working = None
+
+            for trade in trades:
+                for order, sign in ((trade.buy_order, 1), (trade.sell_order, -1)):
+                    if mine.get(order.order_id) is order:
+                        position += sign * trade.quantity
+                        balance -= sign * trade.quantity * trade.price
+                        filled[step] += sign * trade.quantity
+                        fill_notional[step] += trade.quantity * trade.price
+                        fills.append(Fill(step, order.order_id, order.side,
+                                          trade.price, trade.quantity))
+
+            holdings[step] = position
+            cash[step] = balance
+
+        result = data.copy()
+        result['Holdings'] = holdings
+        result['Held_Position'] = holdings / self.order_size
+        result['Filled'] = filled
+        traded = np.abs(filled)
+        result['Fill_Price'] = np.divide(
+            fill_notional, traded, out=np.full(n, np.nan), where=traded > 0)
+        result['Cash'] = cash
+        result['Equity'] = cash + holdings * close
+        result['Strategy_Returns'] = result['Equity'].pct_change()
+        result['Cumulative_Returns'] = result['Equity'] / self.capital
+
+        return SimulationResult(result, fills, events)
+
+    def _order_price(self, book: OrderBook, side: OrderSide, price: float) -> float:
+        tick = self.tick_size
+        if self.execution == "aggressive":
+            offset = self.slippage_ticks * tick
+            return round(price + offset if side == OrderSide.BUY else price - offset, 10)
+
+        # Passive orders join the back of the queue on their own side
+        touch = book.get_best_bid() if side == OrderSide.BUY else book.get_best_ask()
+        if touch is None:
+            touch = price - tick if side == OrderSide.BUY else price + tick
+        return touch
+
+    @staticmethod
+    def _apply(book: OrderBook, engine: MatchingEngine,
+               event: BookEvent) -> List[Trade]:
+        if event.action == "cancel":
+            book.cancel_order(event.order_id)
+            return []
+        if event.action != "add":
+            raise ValueError(f"Unknown book event '{event.action}'")
+        book.add_order(Order(event.order_id, price=event.price,
+                             quantity=event.quantity, side=event.side))
+        return engine.match_orders()
@@ -0,0 +1,104 @@
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+import pandas as pd
+
+from .metrics import MetricsAccumulator
+from .strategies import TradingStrategy
+
+
+def read_chunks(path: Union[str, Path], chunksize: int = 100_000,
+                column_map: Optional[Dict[str, str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read a tick or bar file in chunks of ``chunksize`` rows.
+
+    CSV files are read with the first column as a datetime index. Parquet
+    files need the optional ``pyarrow`` package. ``column_map`` renames
+    source columns, e.g. ``{"price": "Close"}`` for tick data.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading parquet files requires pyarrow") from e
+
+        batches = (batch.to_pandas()
+                   for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize))
+    else:
+        batches = pd.read_csv(path, chunksize=chunksize, index_col=0, parse_dates=True)
+
+    for chunk in batches:
+        if column_map:
+            chunk = chunk.rename(columns=column_map)
+        yield chunk
+
+
+class ChunkedBacktest:
+    """
+    Run a strategy over a history delivered in chunks.
+
+    Each chunk is prefixed with the trailing ``strategy.lookback`` rows of
+    raw data so rolling indicators see the same window as the in-memory
+    path, and the position and cumulative return are carried across
+    chunk boundaries. Peak memory depends on chunk size and lookback,
+    not on the length of the history.
+    """
+
+    def __init__(self, strategy: TradingStrategy):
+        self.strategy = strategy
+
+    def run(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Yield strategy results chunk by chunk"""
+        lookback = max(1, self.strategy.lookback)
+        tail: Optional[pd.DataFrame] = None
+        position = 0.0
+        equity = 1.0
+
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            columns = list(chunk.columns)
+            frame = chunk if tail is None else pd.concat([tail, chunk])
+            overlap = 0 if tail is None else len(tail)
+
+            results = self.strategy.generate_signals(frame)
+            next_tail = results[columns].iloc[-lookback:].copy()
+
+            if overlap:
+                # Keep one overlap row so the first return uses the previous close
+                results = results.iloc[overlap - 1:].copy()
+                results = self.strategy.calculate_returns(
+                    results, initial_position=position, initial_equity=equity)
+                results = results.iloc[1:]
+
+            position = results['Position'].iloc[-1]
+            cumulative = results['Cumulative_Returns'].dropna()
+            if not cumulative.empty:
+                equity = cumulative.iloc[-1]
+            tail = next_tail
+
+            yield results
+
+    def run_file(self, path: Union[str, Path], output: Optional[Union[str, Path]] = None,
+                 chunksize: int = 100_000, column_map: Optional[Dict[str, str]] = None,
+                 periods_per_year: int = 252) -> Dict[str, float]:
+        """
+        Backtest a file chunk by chunk, optionally appending results to ``output``.
+
+        Returns the ``compute_metrics`` summary (as fractions) plus the
+        number of rows, accumulated without holding the history in memory.
+        """
+        metrics = MetricsAccumulator(periods_per_year)
+        rows = 0
+
+        for i, results in enumerate(self.run(read_chunks(path, chunksize, column_map))):
+            if output is not None:
+                results.to_csv(output, mode="w" if i == 0 else "a", header=i == 0)
+            metrics.update(results['Strategy_Returns'].to_numpy(),
+                           results['Position'].to_numpy())
+            rows += len(results)
+
+        summary = metrics.result()
+        summary["rows"] = rows
+        return summary
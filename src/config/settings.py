@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 import json
 
 
@@ -10,6 +10,12 @@ class ServerSettings:
     log_level: str = "INFO"
     max_order_size: int = 1000
     min_price: float = 0.01
+    tick_size: float = 0.01
+    journal_path: Optional[str] = None
+    snapshot_interval: float = 60.0
+    bar_specs: Tuple[str, ...] = ("time:1", "time:60", "tick:100", "volume:1000")
+    matching_mode: str = "continuous"  # or "auction"
+    auction_interval: float = 1.0
 
 
 class ConfigLoader:
@@ -0,0 +1,112 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .matching_engine import Trade
+from .order import Order, OrderSide
+from .order_book import OrderBook
+
+
+class CallAuction:
+    """
+    Batch auction that uncrosses the whole book at a single price.
+
+    Orders rest without matching until ``uncross`` is called. The clearing
+    price maximises executable volume, then minimises the imbalance left
+    over, then lies closest to the reference price (the middle of the
+    tied prices if there is none). Fills are allocated in price-time
+    priority and paired into trades with vectorized NumPy operations
+    instead of one match per pair of orders.
+    """
+
+    def __init__(self, order_book: OrderBook):
+        self.order_book = order_book
+
+    def _queue(self, side: OrderSide) -> Tuple[List[Order], np.ndarray, np.ndarray]:
+        """Orders of one side in priority order, with their prices and quantities"""
+        levels = self.order_book.bids if side == OrderSide.BUY else self.order_book.asks
+        prices = sorted(levels, reverse=side == OrderSide.BUY)
+        orders = [order for price in prices for order in levels[price]]
+        return (orders,
+                np.fromiter((o.price for o in orders), dtype=float, count=len(orders)),
+                np.fromiter((o.remaining_quantity for o in orders), dtype=np.int64,
+                            count=len(orders)))
+
+    def clearing_price(self, reference_price: Optional[float] = None) -> Tuple[Optional[float], int]:
+        """Clearing price and executable volume; (None, 0) if the book does not cross"""
+        _, bid_prices, bid_qty = self._queue(OrderSide.BUY)
+        _, ask_prices, ask_qty = self._queue(OrderSide.SELL)
+        return self._clear(bid_prices, bid_qty, ask_prices, ask_qty, reference_price)
+
+    @staticmethod
+    def _clear(bid_prices, bid_qty, ask_prices, ask_qty,
+               reference_price: Optional[float]) -> Tuple[Optional[float], int]:
+        if not len(bid_prices) or not len(ask_prices) or bid_prices[0] < ask_prices[0]:
+            return None, 0
+
+        candidates = np.unique(np.concatenate([bid_prices, ask_prices]))
+        # Bids arrive price-descending and asks ascending
+        bid_asc, bid_cum = bid_prices[::-1], np.cumsum(bid_qty[::-1])
+        ask_cum = np.cumsum(ask_qty)
+
+        # Demand at p: bids priced >= p; supply at p: asks priced <= p
+        below = np.searchsorted(bid_asc, candidates, side="left")
+        demand = bid_cum[-1] - np.where(below > 0, bid_cum[below - 1], 0)
+        upto = np.searchsorted(ask_prices, candidates, side="right")
+        supply = np.where(upto > 0, ask_cum[upto - 1], 0)
+
+        volume = np.minimum(demand, supply)
+        best = volume.max()
+        if best <= 0:
+            return None, 0
+        tied = volume == best
+        imbalance = np.abs(demand - supply)
+        tied &= imbalance == imbalance[tied].min()
+
+        prices = candidates[tied]
+        if reference_price is not None:
+            price = prices[np.argmin(np.abs(prices - reference_price))]
+        else:
+            price = prices[(len(prices) - 1) // 2]
+        return float(price), int(best)
+
+    @staticmethod
+    def _allocate(quantities: np.ndarray, eligible: int, volume: int) -> np.ndarray:
+        """Fill the first ``eligible`` orders in priority order up to ``volume``"""
+        fills = np.zeros(len(quantities), dtype=np.int64)
+        cum = np.cumsum(quantities[:eligible])
+        before = cum - quantities[:eligible]
+        fills[:eligible] = np.clip(volume - before, 0, quantities[:eligible])
+        return fills
+
+    def uncross(self, reference_price: Optional[float] = None) -> List[Trade]:
+        """Execute every crossing order at one clearing price; returns the trades"""
+        bids, bid_prices, bid_qty = self._queue(OrderSide.BUY)
+        asks, ask_prices, ask_qty = self._queue(OrderSide.SELL)
+        price, volume = self._clear(bid_prices, bid_qty, ask_prices, ask_qty, reference_price)
+        if price is None:
+            return []
+
+        bid_fills = self._allocate(bid_qty, int(np.searchsorted(-bid_prices, -price, side="right")), volume)
+        ask_fills = self._allocate(ask_qty, int(np.searchsorted(ask_prices, price, side="right")), volume)
+
+        # Pair buyers and sellers by overlapping their cumulative fill intervals
+        bid_ends = np.cumsum(bid_fills)
+        ask_ends = np.cumsum(ask_fills)
+        cuts = np.union1d(bid_ends[bid_fills > 0], ask_ends[ask_fills > 0])
+        starts = np.concatenate([[0], cuts[:-1]])
+        buyer = np.searchsorted(bid_ends, starts, side="right")
+        seller = np.searchsorted(ask_ends, starts, side="right")
+        sizes = cuts - starts
+
+        book = self.order_book
+        trades = [Trade(bids[b], asks[s], price, int(q))
+                  for b, s, q in zip(buyer.tolist(), seller.tolist(), sizes.tolist())]
+
+        for orders, fills in ((bids, bid_fills), (asks, ask_fills)):
+            for i in np.flatnonzero(fills).tolist():
+                order = orders[i]
+                book.fill(order, int(fills[i]))
+                if order.is_filled:
+                    book.remove_filled(order)
+        return trades
@@ -0,0 +1,198 @@
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+import math
+import time
+
+import numpy as np
+
+from .matching_engine import Trade
+
+BAR_DTYPE = np.dtype([
+    ("start", np.int64),  # ns timestamp of the first trade (time bars: interval start)
+    ("end", np.int64),    # ns timestamp of the last trade
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.int64),
+    ("trades", np.int64),
+])
+
+
+class BarSpec(NamedTuple):
+    """
+    A bar type and resolution.
+
+    ``kind`` is "time" (``size`` seconds), "tick" (``size`` trades) or
+    "volume" (``size`` units traded).
+    """
+    kind: str
+    size: float
+
+    @classmethod
+    def parse(cls, text: str) -> "BarSpec":
+        """Parse a spec such as time:60, tick:100 or volume:5000"""
+        kind, _, size = text.partition(":")
+        try:
+            return cls(kind, float(size)).validate()
+        except ValueError:
+            raise ValueError(f"Invalid bar spec '{text}'") from None
+
+    def validate(self) -> "BarSpec":
+        """Return the spec, or raise ValueError if it could never close a bar"""
+        if (self.kind not in ("time", "tick", "volume") or not math.isfinite(self.size)
+                or self.size <= 0 or (self.kind == "time" and int(self.size * 1e9) < 1)):
+            raise ValueError(f"Invalid bar spec '{self}'")
+        return self
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.size:g}"
+
+
+class Bar(NamedTuple):
+    start: int
+    end: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+    trades: int
+
+
+class BarSeries:
+    """Ring buffer holding the most recent ``capacity`` closed bars"""
+
+    def __init__(self, capacity: int = 1024):
+        self._bars = np.zeros(max(1, capacity), dtype=BAR_DTYPE)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return len(self._bars)
+
+    def append(self, bar: Bar) -> None:
+        self._bars[self._next] = bar
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def latest(self, count: Optional[int] = None) -> np.ndarray:
+        """The newest ``count`` bars (default all held), oldest first"""
+        count = self._count if count is None else min(count, self._count)
+        index = (self._next - count + np.arange(count)) % self.capacity
+        return self._bars[index]
+
+    def to_frame(self, count: Optional[int] = None):
+        """Bars as an Open/High/Low/Close/Volume DataFrame, as the strategies expect"""
+        import pandas as pd
+
+        bars = self.latest(count)
+        return pd.DataFrame({
+            "Open": bars["open"],
+            "High": bars["high"],
+            "Low": bars["low"],
+            "Close": bars["close"],
+            "Volume": bars["volume"],
+            "Trades": bars["trades"],
+        }, index=pd.to_datetime(bars["start"], unit="ns", utc=True))
+
+
+class _OpenBar:
+    __slots__ = ("start", "end", "open", "high", "low", "close", "volume", "trades")
+
+    def __init__(self, start: int, timestamp: int, price: float):
+        self.start = start
+        self.end = timestamp
+        self.open = self.high = self.low = self.close = price
+        self.volume = 0
+        self.trades = 0
+
+    def to_bar(self) -> Bar:
+        return Bar(self.start, self.end, self.open, self.high, self.low,
+                   self.close, self.volume, self.trades)
+
+
+class BarBuilder:
+    """
+    Builds time, tick and volume bars from trades as they happen.
+
+    Each trade updates the open bar of every spec in O(1); a bar that
+    closes is appended to that spec's ring buffer and passed to every
+    subscriber. Time bars are aligned to multiples of their interval and
+    close on the first trade of a later interval or on ``flush``;
+    intervals without trades produce no bar. A trade is never split, so a
+    volume bar can overshoot its size by the last trade.
+    """
+
+    def __init__(self, specs: Iterable[BarSpec], capacity: int = 1024):
+        self.specs: List[BarSpec] = [BarSpec.parse(s) if isinstance(s, str) else s.validate()
+                                     for s in specs]
+        self.series: Dict[BarSpec, BarSeries] = {s: BarSeries(capacity) for s in self.specs}
+        self._open: Dict[BarSpec, Optional[_OpenBar]] = {s: None for s in self.specs}
+        self._subscribers: List[Callable[[BarSpec, Bar], None]] = []
+
+    def subscribe(self, callback: Callable[[BarSpec, Bar], None]) -> None:
+        """Call ``callback(spec, bar)`` for every bar that closes"""
+        self._subscribers.append(callback)
+
+    def _close(self, spec: BarSpec) -> None:
+        bar = self._open[spec].to_bar()
+        self._open[spec] = None
+        self.series[spec].append(bar)
+        for callback in self._subscribers:
+            callback(spec, bar)
+
+    def on_trade(self, price: float, quantity: int, timestamp: Optional[int] = None) -> None:
+        if timestamp is None:
+            timestamp = time.time_ns()
+        for spec in self.specs:
+            current = self._open[spec]
+            if spec.kind == "time":
+                interval = int(spec.size * 1e9)
+                start = timestamp - timestamp % interval
+                if current is not None and start != current.start:
+                    self._close(spec)
+                    current = None
+            else:
+                start = timestamp
+
+            if current is None:
+                current = self._open[spec] = _OpenBar(start, timestamp, price)
+            else:
+                if price > current.high:
+                    current.high = price
+                elif price < current.low:
+                    current.low = price
+                current.close = price
+                current.end = timestamp
+            current.volume += quantity
+            current.trades += 1
+
+            if (spec.kind == "tick" and current.trades >= spec.size) or \
+                    (spec.kind == "volume" and current.volume >= spec.size):
+                self._close(spec)
+
+    def on_trades(self, trades: Iterable[Trade], timestamp: Optional[int] = None) -> None:
+        """Consume a batch of matched trades, all stamped with the same time"""
+        if timestamp is None:
+            timestamp = time.time_ns()
+        for trade in trades:
+            self.on_trade(trade.price, trade.quantity, timestamp)
+
+    def flush(self, timestamp: Optional[int] = None) -> None:
+        """Close time bars whose interval ended before ``timestamp``"""
+        if timestamp is None:
+            timestamp = time.time_ns()
+        for spec in self.specs:
+            current = self._open[spec]
+            if spec.kind == "time" and current is not None and \
+                    timestamp >= current.start + int(spec.size * 1e9):
+                self._close(spec)
+
+    def current(self, spec: BarSpec) -> Optional[Bar]:
+        """The bar still being built for ``spec``, if any"""
+        current = self._open[spec]
+        return current.to_bar() if current is not None else None
@@ -0,0 +1,264 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from .order import OrderSide
+
+# Price levels an empty window lets pile up beyond it before following them
+OVERFLOW_LEVELS = 64
+
+
+class _SideIndex:
+    """
+    Depth for one side: Fenwick trees over a fixed window of ticks running
+    outward from the touch, plus a sparse overflow for ticks beyond it.
+
+    Position 0 is the most aggressive tick of the window (lowest ask,
+    highest bid), so prefix sums run outward from the touch. The window
+    follows the touch and never grows, so an outlier price only costs an
+    overflow entry. Notional is kept in integer ticks x quantity so sums
+    stay exact.
+    """
+
+    def __init__(self, side: OrderSide, size: int):
+        self.direction = 1 if side == OrderSide.SELL else -1
+        self.size = size
+        self.start: Optional[int] = None  # tick at position 0
+        self.level_qty: List[int] = [0] * size
+        self._qty: List[int] = [0] * (size + 1)
+        self._notional: List[int] = [0] * (size + 1)
+        self.far_qty: Dict[int, int] = {}  # position -> quantity, beyond the window
+        self.far_positions: List[int] = []
+
+    def tick_at(self, position: int) -> int:
+        return self.start + self.direction * position
+
+    def position(self, tick: int) -> int:
+        return (tick - self.start) * self.direction
+
+    def _add(self, position: int, qty: int, notional: int) -> None:
+        self.level_qty[position] += qty
+        tree_qty, tree_notional, size = self._qty, self._notional, self.size
+        i = position + 1
+        while i <= size:
+            tree_qty[i] += qty
+            tree_notional[i] += notional
+            i += i & -i
+
+    def _add_far(self, position: int, qty: int) -> None:
+        remaining = self.far_qty.get(position, 0) + qty
+        if remaining:
+            if position not in self.far_qty:
+                insort(self.far_positions, position)
+            self.far_qty[position] = remaining
+        elif position in self.far_qty:
+            del self.far_qty[position]
+            self.far_positions.pop(bisect_left(self.far_positions, position))
+
+    def _recentre(self, anchor: int) -> None:
+        """
+        Move the window so ``anchor`` sits a quarter of the way in.
+
+        Scans the window only if it holds quantity, so moving an empty
+        window costs O(overflow levels x log levels).
+        """
+        size = self.size
+        held = [(self.tick_at(p), qty) for p, qty in self.far_qty.items()]
+        if self._qty_in_window():
+            held.extend((self.tick_at(p), qty) for p, qty in enumerate(self.level_qty) if qty)
+        self.start = anchor - self.direction * (size // 4)
+        self.level_qty = [0] * size
+        self._qty = [0] * (size + 1)
+        self._notional = [0] * (size + 1)
+        self.far_qty = {}
+        for tick, qty in held:
+            position = self.position(tick)
+            if position < size:
+                self._add(position, qty, qty * tick)
+            else:
+                self.far_qty[position] = qty
+        self.far_positions = sorted(self.far_qty)
+
+    def update(self, tick: int, qty: int) -> None:
+        if self.start is None:
+            self.start = tick - self.direction * (self.size // 4)
+        position = (tick - self.start) * self.direction
+        if 0 <= position < self.size:
+            # Includes the window emptying: queries fall through to the overflow
+            self._add(position, qty, qty * tick)
+            return
+
+        # Every re-centre needs the touch to have moved a quarter of the
+        # window (or the overflow to have filled up), so its O(levels)
+        # cost is amortised over that much activity
+        if position < 0:
+            # New touch ahead of the window
+            self._recentre(tick)
+        else:
+            best = self.search(1)[0]
+            if best is None:
+                self._recentre(tick)  # side was empty
+            elif self.size // 2 <= best < self.size:
+                # Touch has drifted deep into the window
+                self._recentre(self.tick_at(best))
+            elif best >= self.size and len(self.far_positions) >= OVERFLOW_LEVELS:
+                # Window empty and the book now lives in the overflow
+                self._recentre(self.tick_at(min(best, position)))
+        position = self.position(tick)
+        if position < self.size:
+            self._add(position, qty, qty * tick)
+        else:
+            self._add_far(position, qty)
+
+    def _qty_in_window(self) -> int:
+        return self._window_prefix(self.size)[0]
+
+    def _window_prefix(self, count: int) -> Tuple[int, int]:
+        qty = notional = 0
+        i = min(count, self.size)
+        while i > 0:
+            qty += self._qty[i]
+            notional += self._notional[i]
+            i -= i & -i
+        return qty, notional
+
+    def level(self, position: int) -> int:
+        if 0 <= position < self.size:
+            return self.level_qty[position]
+        return self.far_qty.get(position, 0)
+
+    def prefix(self, count: int) -> Tuple[int, int]:
+        """Sums over positions before ``count``"""
+        qty, notional = self._window_prefix(count)
+        if count > self.size:
+            for position in self.far_positions:
+                if position >= count:
+                    break
+                far = self.far_qty[position]
+                qty += far
+                notional += far * self.tick_at(position)
+        return qty, notional
+
+    def search(self, target: int) -> Tuple[Optional[int], int, int]:
+        """
+        Fewest leading positions whose quantity reaches ``target``.
+
+        Returns ``(position, qty_before, notional_before)`` where position
+        is the level at which the running total first reaches the target,
+        or None if the side holds less than that.
+        """
+        if self.start is None:
+            return None, 0, 0
+        position = 0
+        qty = notional = 0
+        size = self.size
+        step = 1 << size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= size and qty + self._qty[nxt] < target:
+                position = nxt
+                qty += self._qty[nxt]
+                notional += self._notional[nxt]
+            step >>= 1
+        if position < size:
+            return position, qty, notional
+        for position in self.far_positions:
+            far = self.far_qty[position]
+            if qty + far >= target:
+                return position, qty, notional
+            qty += far
+            notional += far * self.tick_at(position)
+        return None, qty, notional
+
+
+class DepthIndex:
+    """
+    Cumulative depth by price for both sides of an order book.
+
+    Every book change updates a Fenwick tree over tick levels, so depth at
+    a price, quantity within N ticks of the touch and the cost of filling
+    a given quantity are all O(log levels). Prices are bucketed to the
+    nearest tick. Each side indexes a fixed window of ``levels`` ticks that
+    follows its touch; prices beyond it are kept sparsely and walked
+    linearly, so memory stays bounded whatever prices arrive.
+    """
+
+    def __init__(self, tick_size: float = 0.01, levels: int = 4096):
+        self.tick_size = tick_size
+        size = max(4, levels)
+        self._sides = {OrderSide.BUY: _SideIndex(OrderSide.BUY, size),
+                       OrderSide.SELL: _SideIndex(OrderSide.SELL, size)}
+
+    def _tick(self, price: float) -> int:
+        return int(round(price / self.tick_size))
+
+    def update(self, side: OrderSide, price: float, quantity: int) -> None:
+        """Add (or with a negative quantity, remove) resting quantity at a price"""
+        if quantity:
+            self._sides[side].update(int(round(price / self.tick_size)), quantity)
+
+    def best_price(self, side: OrderSide) -> Optional[float]:
+        index = self._sides[side]
+        position = index.search(1)[0]
+        if position is None:
+            return None
+        return index.tick_at(position) * self.tick_size
+
+    def depth_at_price(self, side: OrderSide, price: float) -> int:
+        """Resting quantity at exactly one price level"""
+        index = self._sides[side]
+        if index.start is None:
+            return 0
+        return index.level(index.position(self._tick(price)))
+
+    def cumulative_depth(self, side: OrderSide, price: float) -> int:
+        """Quantity at this price or better (asks at or below, bids at or above)"""
+        index = self._sides[side]
+        if index.start is None:
+            return 0
+        position = index.position(self._tick(price))
+        if position < 0:
+            return 0
+        return index.prefix(position + 1)[0]
+
+    def total_depth(self, side: OrderSide) -> int:
+        index = self._sides[side]
+        return index._qty_in_window() + sum(index.far_qty.values())
+
+    def quantity_within(self, side: OrderSide, ticks: int) -> int:
+        """Quantity from the touch out to ``ticks`` ticks behind it, inclusive"""
+        index = self._sides[side]
+        best = index.search(1)[0]
+        if best is None:
+            return 0
+        return index.prefix(best + ticks + 1)[0]
+
+    def fill_cost(self, side: OrderSide, quantity: int) -> Tuple[int, float]:
+        """
+        Quantity and notional an aggressor on ``side`` would get for ``quantity``.
+
+        A buyer walks the asks and a seller the bids. If the book is too
+        thin the result covers only what is resting.
+        """
+        if quantity <= 0:
+            return 0, 0.0
+        resting = OrderSide.SELL if side == OrderSide.BUY else OrderSide.BUY
+        index = self._sides[resting]
+        position, qty, notional_ticks = index.search(quantity)
+        if position is None:
+            return qty, notional_ticks * self.tick_size
+        notional_ticks += (quantity - qty) * index.tick_at(position)
+        return quantity, notional_ticks * self.tick_size
+
+    def vwap_to_fill(self, side: OrderSide, quantity: int) -> Optional[float]:
+        """Average price an aggressor on ``side`` would pay or receive"""
+        filled, notional = self.fill_cost(side, quantity)
+        return notional / filled if filled else None
+
+    def impact_cost(self, side: OrderSide, quantity: int) -> Optional[float]:
+        """Fractional slippage of the fill VWAP relative to the touch"""
+        resting = OrderSide.SELL if side == OrderSide.BUY else OrderSide.BUY
+        touch = self.best_price(resting)
+        vwap = self.vwap_to_fill(side, quantity)
+        if touch is None or vwap is None:
+            return None
+        return (vwap - touch) / touch if side == OrderSide.BUY else (touch - vwap) / touch
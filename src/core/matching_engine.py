@@ -5,6 +5,8 @@ import logging
 
 
 class Trade:
+    __slots__ = ("buy_order", "sell_order", "price", "quantity")
+
     def __init__(self, buy_order: Order, sell_order: Order,
                  price: float, quantity: int):
         self.buy_order = buy_order
@@ -14,32 +16,35 @@ class Trade:
 
 
 class MatchingEngine:
-    def __init__(self, order_book: OrderBook):
+    def __init__(self, order_book: OrderBook, log_trades: bool = True):
         self.order_book = order_book
+        # Simulations turn this off; a log line per match dominates the hot path
+        self.log_trades = log_trades
         self.logger = logging.getLogger(__name__)
 
     def match_orders(self) -> List[Trade]:
         trades = []
+        book = self.order_book
 
         while True:
-            best_bid = self.order_book.get_best_bid()
-            best_ask = self.order_book.get_best_ask()
+            best_bid = book.get_best_bid()
+            best_ask = book.get_best_ask()
 
-            if not (best_bid and best_ask and best_bid >= best_ask):
+            if best_bid is None or best_ask is None or best_bid < best_ask:
                 break
 
-            bid_orders = self.order_book.bids[best_bid]
-            ask_orders = self.order_book.asks[best_ask]
-
-            if not (bid_orders and ask_orders):
-                break
+            bid = book.bids[best_bid][0]
+            ask = book.asks[best_ask][0]
 
-            trade = self._match_orders_at_price(bid_orders[0], ask_orders[0])
+            trade = self._match_orders_at_price(bid, ask)
             if trade:
                 trades.append(trade)
 
-            # Clean up filled orders
-            self._cleanup_filled_orders()
+            # Clean up filled orders; only the two touched levels can change
+            if bid.is_filled:
+                book.remove_filled(bid)
+            if ask.is_filled:
+                book.remove_filled(ask)
 
         return trades
 
@@ -47,22 +52,13 @@ class MatchingEngine:
         quantity = min(bid.remaining_quantity, ask.remaining_quantity)
         price = ask.price  # Using ask price for this example
 
-        bid.filled_quantity += quantity
-        ask.filled_quantity += quantity
+        self.order_book.fill(bid, quantity)
+        self.order_book.fill(ask, quantity)
 
-        self.logger.info(
-            f"Matched: {bid.order_id} with {ask.order_id} "
-            f"at {price} x {quantity}"
-        )
+        if self.log_trades:
+            self.logger.info(
+                "Matched: %s with %s at %s x %s",
+                bid.order_id, ask.order_id, price, quantity
+            )
 
         return Trade(bid, ask, price, quantity)
-
-    def _cleanup_filled_orders(self):
-        for order_dict in [self.order_book.bids, self.order_book.asks]:
-            for price in list(order_dict.keys()):
-                order_dict[price] = [
-                    order for order in order_dict[price]
-                    if not order.is_filled
-                ]
-                if not order_dict[price]:
-                    del order_dict[price]
@@ -1,15 +1,22 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
+from bisect import bisect_left
 from .order import Order, OrderSide
+from .depth_index import DepthIndex
 import logging
 
 
 class OrderBook:
-    def __init__(self):
+    def __init__(self, depth: Optional[DepthIndex] = None):
         # Price level -> Orders at that price
         self.bids: Dict[float, List[Order]] = defaultdict(list)
         self.asks: Dict[float, List[Order]] = defaultdict(list)
         self.orders: Dict[str, Order] = {}  # Order ID -> Order
+        # Sorted prices of non-empty levels, so the touch is O(1)
+        self._bid_prices: List[float] = []
+        self._ask_prices: List[float] = []
+        # Optional cumulative depth, kept in step with every book change
+        self.depth = depth
         self.logger = logging.getLogger(__name__)
 
     def add_order(self, order: Order) -> bool:
@@ -18,27 +25,77 @@ class OrderBook:
             return False
 
         self.orders[order.order_id] = order
-        order_dict = self.bids if order.side == OrderSide.BUY else self.asks
-        order_dict[order.price].append(order)
+        if order.side == OrderSide.BUY:
+            order_dict, prices = self.bids, self._bid_prices
+        else:
+            order_dict, prices = self.asks, self._ask_prices
+
+        level = order_dict[order.price]
+        if not level:
+            i = bisect_left(prices, order.price)
+            if i == len(prices) or prices[i] != order.price:
+                prices.insert(i, order.price)
+        level.append(order)
+        if self.depth is not None:
+            self.depth.update(order.side, order.price, order.remaining_quantity)
         return True
 
     def cancel_order(self, order_id: str) -> Optional[Order]:
         if order_id not in self.orders:
             return None
 
-        order = self.orders[order_id]
-        order_dict = self.bids if order.side == OrderSide.BUY else self.asks
+        order = self.orders.pop(order_id)
+        self._remove_from_level(order)
+        if self.depth is not None:
+            self.depth.update(order.side, order.price, -order.remaining_quantity)
+        return order
+
+    def fill(self, order: Order, quantity: int) -> None:
+        """Execute ``quantity`` of a resting order."""
+        order.filled_quantity += quantity
+        if self.depth is not None:
+            self.depth.update(order.side, order.price, -quantity)
 
-        if order.price in order_dict:
-            order_dict[order.price].remove(order)
-            if not order_dict[order.price]:
-                del order_dict[order.price]
+    def remove_filled(self, order: Order) -> None:
+        """Drop a fully filled order from its price level and the order index."""
+        self.orders.pop(order.order_id, None)
+        self._remove_from_level(order)
 
-        del self.orders[order_id]
-        return order
+    def _remove_from_level(self, order: Order) -> None:
+        if order.side == OrderSide.BUY:
+            order_dict, prices = self.bids, self._bid_prices
+        else:
+            order_dict, prices = self.asks, self._ask_prices
+
+        level = order_dict.get(order.price)
+        if level is None:
+            return
+
+        # Match by identity; fills always leave from the front of the queue
+        for i, queued in enumerate(level):
+            if queued is order:
+                del level[i]
+                break
+
+        if not level:
+            del order_dict[order.price]
+            i = bisect_left(prices, order.price)
+            if i < len(prices) and prices[i] == order.price:
+                del prices[i]
+
+    def top_levels(self, side: OrderSide, count: int) -> List[Tuple[float, int]]:
+        """(price, remaining quantity) of the best ``count`` levels on one side."""
+        if count <= 0:
+            return []
+        if side == OrderSide.BUY:
+            order_dict, prices = self.bids, self._bid_prices[:-count - 1:-1]
+        else:
+            order_dict, prices = self.asks, self._ask_prices[:count]
+        return [(price, sum(o.remaining_quantity for o in order_dict[price]))
+                for price in prices]
 
     def get_best_bid(self) -> Optional[float]:
-        return max(self.bids.keys()) if self.bids else None
+        return self._bid_prices[-1] if self._bid_prices else None
 
     def get_best_ask(self) -> Optional[float]:
-        return min(self.asks.keys()) if self.asks else None
+        return self._ask_prices[0] if self._ask_prices else None
@@ -0,0 +1,119 @@
+import json
+import os
+import time
+from typing import Optional
+
+from ..core.matching_engine import Trade
+from ..core.order import Order, OrderSide
+from ..core.order_book import OrderBook
+from ..core.trade_tape import TradeTape
+
+
+class EventJournal:
+    """
+    Append-only journal of the primary's book events, one JSON object per line.
+
+    Events carry a gap-free ``seq`` and a nanosecond ``ts``:
+
+        {"seq": 1, "ts": ..., "type": "add", "order_id": "B1", "side": "BUY",
+         "price": 100.0, "quantity": 10}
+        {"seq": 2, "ts": ..., "type": "cancel", "order_id": "B1"}
+        {"seq": 3, "ts": ..., "type": "trade", "buy": "B2", "sell": "S1",
+         "price": 100.0, "quantity": 5}
+
+    Replaying adds, cancels and trades in order reproduces the primary's
+    book without re-running matching. Snapshots of the book plus recent
+    trades let replicas resync without replaying from the start.
+    """
+
+    def __init__(self, path: str, snapshot_path: Optional[str] = None,
+                 snapshot_trades: int = 10_000):
+        self.path = path
+        self.snapshot_path = snapshot_path or f"{path}.snapshot"
+        self.snapshot_trades = snapshot_trades
+        self._file = open(path, "ab")
+        self.offset = self._file.tell()
+        self.seq = self._last_seq() if self.offset else 0
+
+    def _last_seq(self) -> int:
+        """Sequence of the last complete event when appending to an existing journal"""
+        with open(self.path, "rb") as f:
+            f.seek(max(0, self.offset - 65536))
+            lines = f.read().splitlines()
+        for line in reversed(lines):
+            try:
+                return json.loads(line)["seq"]
+            except (ValueError, KeyError):
+                continue
+        return 0
+
+    def _write(self, event: dict, timestamp: Optional[int] = None) -> None:
+        self.seq += 1
+        event["seq"] = self.seq
+        event["ts"] = time.time_ns() if timestamp is None else timestamp
+        self._file.write(json.dumps(event, separators=(",", ":")).encode() + b"\n")
+
+    def record_add(self, order: Order) -> None:
+        self._write({"type": "add", "order_id": order.order_id, "side": order.side.value,
+                     "price": order.price, "quantity": order.quantity})
+
+    def record_cancel(self, order_id: str) -> None:
+        self._write({"type": "cancel", "order_id": order_id})
+
+    def record_trade(self, trade: Trade, timestamp: Optional[int] = None) -> None:
+        """Journal a trade, stamped with the time the trade tape gave it"""
+        self._write({"type": "trade", "buy": trade.buy_order.order_id,
+                     "sell": trade.sell_order.order_id, "price": trade.price,
+                     "quantity": trade.quantity}, timestamp)
+
+    def flush(self) -> None:
+        self._file.flush()
+        self.offset = self._file.tell()
+
+    def write_snapshot(self, book: OrderBook, tape: Optional[TradeTape] = None) -> None:
+        """Atomically write the book state as of the current journal offset"""
+        self.flush()
+        orders = []
+        for levels, prices in ((book.bids, sorted(book.bids, reverse=True)),
+                               (book.asks, sorted(book.asks))):
+            for price in prices:
+                # Queue order within a level is preserved
+                orders.extend([o.order_id, o.side.value, o.price, o.quantity, o.filled_quantity]
+                              for o in levels[price])
+
+        trades = []
+        if tape is not None and len(tape):
+            recent = tape.slice()[-self.snapshot_trades:]
+            trades = [[int(ts), float(price), int(qty), buy.decode(), sell.decode()]
+                      for _, ts, price, qty, buy, sell in recent.tolist()]
+
+        snapshot = {"seq": self.seq, "offset": self.offset, "ts": time.time_ns(),
+                    "orders": orders, "trades": trades}
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(tmp_path, self.snapshot_path)
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+
+def load_snapshot(path: str, book: OrderBook, tape: TradeTape) -> dict:
+    """Rebuild ``book`` and ``tape`` from a snapshot; returns its header"""
+    with open(path, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    for order_id, side, price, quantity, filled in snapshot["orders"]:
+        order = Order(order_id, price=price, quantity=quantity, side=OrderSide(side))
+        book.add_order(order)
+        if filled:
+            book.fill(order, filled)
+    for ts, price, quantity, buy, sell in snapshot["trades"]:
+        tape.record(price, quantity, buy, sell, ts)
+    return {"seq": snapshot["seq"], "offset": snapshot["offset"], "ts": snapshot["ts"]}
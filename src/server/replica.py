@@ -0,0 +1,281 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Optional
+
+from ..core.depth_index import DepthIndex
+from ..core.order import Order, OrderSide
+from ..core.order_book import OrderBook
+from ..core.trade_tape import TradeTape
+from ..utils.logger import LoggerSetup
+from .journal import load_snapshot
+
+
+class ReplicaEngine:
+    """
+    Read-only copy of the primary's book, rebuilt by tailing its journal.
+
+    The replica never matches; it applies the primary's adds, cancels and
+    trades in journal order. If it falls more than ``max_lag_bytes`` behind
+    it jumps to the latest snapshot when that is ahead of it, and otherwise
+    keeps tailing. A sequence gap or a truncated journal forces a resync
+    from the snapshot (or a replay from the start if there is none).
+    """
+
+    def __init__(self, journal_path: str, snapshot_path: Optional[str] = None,
+                 tick_size: float = 0.01, max_lag_bytes: int = 64 * 1024 * 1024,
+                 read_size: int = 256 * 1024):
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path or f"{journal_path}.snapshot"
+        self.tick_size = tick_size
+        self.max_lag_bytes = max_lag_bytes
+        self.read_size = read_size
+        self.logger = logging.getLogger(__name__)
+        self.resyncs = 0
+        self._stale_snapshot: Optional[int] = None  # mtime of a snapshot known to be behind
+        self._reset()
+
+    def _reset(self) -> None:
+        self.order_book = OrderBook(DepthIndex(self.tick_size))
+        self.trade_tape = TradeTape()
+        self.offset = 0
+        self.seq = 0
+        self.last_event_ts: Optional[int] = None
+
+    def resync(self, ahead_only: bool = False) -> bool:
+        """
+        Rebuild from the latest snapshot; False if there is none.
+
+        With ``ahead_only`` a snapshot no further along the journal than
+        this replica is ignored (and not re-read until it changes).
+        """
+        try:
+            stamp = os.stat(self.snapshot_path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if ahead_only and stamp == self._stale_snapshot:
+            return False
+
+        book = OrderBook(DepthIndex(self.tick_size))
+        tape = TradeTape()
+        header = load_snapshot(self.snapshot_path, book, tape)
+        if ahead_only and header["offset"] <= self.offset:
+            self._stale_snapshot = stamp
+            return False
+
+        self.order_book = book
+        self.trade_tape = tape
+        self.offset = header["offset"]
+        self.seq = header["seq"]
+        self.last_event_ts = header["ts"]
+        self.resyncs += 1
+        self.logger.info(f"Resynced from snapshot at seq {self.seq}")
+        return True
+
+    def lag_bytes(self) -> int:
+        try:
+            return max(0, os.path.getsize(self.journal_path) - self.offset)
+        except FileNotFoundError:
+            return 0
+
+    def poll(self) -> int:
+        """
+        Apply the complete events in the next ``read_size`` bytes of journal.
+
+        Returns the count applied. Work per call is bounded so a replica
+        catching up can keep answering queries between polls.
+        """
+        try:
+            size = os.path.getsize(self.journal_path)
+        except FileNotFoundError:
+            return 0
+
+        if size < self.offset:
+            # Truncated/rotated journal: what we hold no longer matches it
+            if not self.resync():
+                self._reset()
+        elif size - self.offset > self.max_lag_bytes:
+            # Too far behind: skip ahead only if a snapshot is further along
+            self.resync(ahead_only=True)
+
+        applied = 0
+        with open(self.journal_path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(self.read_size)
+        end = data.rfind(b"\n")
+        if end < 0:
+            return 0  # nothing new, or only a partial line
+        for line in data[:end].split(b"\n"):
+            event = json.loads(line)
+            if event["seq"] <= self.seq:
+                continue
+            if event["seq"] != self.seq + 1:
+                self.logger.warning(
+                    f"Journal gap: expected seq {self.seq + 1}, got {event['seq']}")
+                if self.resync():
+                    return applied
+                raise RuntimeError("Journal gap and no snapshot to resync from")
+            self._apply(event)
+            applied += 1
+        self.offset += end + 1
+        return applied
+
+    def _apply(self, event: dict) -> None:
+        kind = event["type"]
+        book = self.order_book
+        if kind == "add":
+            book.add_order(Order(event["order_id"], price=event["price"],
+                                 quantity=event["quantity"], side=OrderSide(event["side"])))
+        elif kind == "cancel":
+            book.cancel_order(event["order_id"])
+        elif kind == "trade":
+            quantity = event["quantity"]
+            for order_id in (event["buy"], event["sell"]):
+                order = book.orders.get(order_id)
+                if order is not None:
+                    book.fill(order, quantity)
+                    if order.is_filled:
+                        book.remove_filled(order)
+            self.trade_tape.record(event["price"], quantity, event["buy"],
+                                   event["sell"], event["ts"])
+        else:
+            raise ValueError(f"Unknown journal event '{kind}'")
+        self.seq = event["seq"]
+        self.last_event_ts = event["ts"]
+
+    def status(self) -> dict:
+        lag_seconds = None
+        if self.last_event_ts is not None:
+            lag_seconds = max(0.0, (time.time_ns() - self.last_event_ts) / 1e9)
+        return {"seq": self.seq, "lag_bytes": self.lag_bytes(),
+                "seconds_since_last_event": lag_seconds, "resyncs": self.resyncs}
+
+    def handle_query(self, request: dict) -> dict:
+        """Answer one market-data query"""
+        kind = request.get("type")
+        depth = self.order_book.depth
+        if kind == "book":
+            levels = int(request.get("levels", 10))
+            return {"seq": self.seq,
+                    "bids": self.order_book.top_levels(OrderSide.BUY, levels),
+                    "asks": self.order_book.top_levels(OrderSide.SELL, levels)}
+        if kind == "depth":
+            side = OrderSide(request["side"])
+            price = float(request["price"])
+            return {"seq": self.seq, "at_price": depth.depth_at_price(side, price),
+                    "cumulative": depth.cumulative_depth(side, price)}
+        if kind == "fill_cost":
+            side = OrderSide(request["side"])
+            filled, notional = depth.fill_cost(side, int(request["quantity"]))
+            return {"seq": self.seq, "filled": filled, "notional": notional,
+                    "vwap": notional / filled if filled else None}
+        if kind == "trades":
+            records = self.trade_tape.slice(request.get("start"), request.get("end"))
+            limit = int(request.get("limit", 1000))
+            return {"seq": self.seq, "trades": [
+                [seq, ts, price, qty, buy.decode(), sell.decode()]
+                for seq, ts, price, qty, buy, sell in records[-limit:].tolist()]}
+        if kind == "status":
+            return self.status()
+        return {"error": f"Unknown query type '{kind}'"}
+
+
+class ReplicaServer:
+    """Tails the journal and serves newline-delimited JSON queries over TCP"""
+
+    def __init__(self, replica: ReplicaEngine, host: str = "127.0.0.1", port: int = 0,
+                 poll_interval: float = 0.05):
+        self.replica = replica
+        self.host = host
+        self.port = port
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._poll_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> int:
+        """Start serving; returns the bound port"""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._poll_task = asyncio.create_task(self._poll_loop())
+        self.logger.info(f"Replica serving on {self.host}:{self.port}")
+        return self.port
+
+    async def stop(self) -> None:
+        if self._poll_task:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _poll_loop(self) -> None:
+        while True:
+            behind = False
+            try:
+                offset = self.replica.offset
+                self.replica.poll()
+                behind = self.replica.offset != offset and self.replica.lag_bytes() > 0
+            except Exception as e:
+                self.logger.error(f"Error applying journal: {e}", exc_info=True)
+            # While catching up, yield between batches so queries are served
+            await asyncio.sleep(0 if behind else self.poll_interval)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.replica.handle_query(json.loads(line))
+                except Exception as e:
+                    response = {"error": str(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def _serve(args) -> None:
+    replica = ReplicaEngine(args.journal, args.snapshot, tick_size=args.tick_size,
+                            max_lag_bytes=args.max_lag_bytes)
+    replica.resync()
+    server = ReplicaServer(replica, args.host, args.port, args.poll_interval)
+    await server.start()
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server.replica",
+        description="Serve market-data queries from a replica of the primary's journal")
+    parser.add_argument("--journal", required=True)
+    parser.add_argument("--snapshot", default=None)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=12001)
+    parser.add_argument("--tick-size", type=float, default=0.01)
+    parser.add_argument("--max-lag-bytes", type=int, default=64 * 1024 * 1024)
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args(argv)
+
+    LoggerSetup.setup(level=args.log_level)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,36 @@
 import asyncio
 import logging
-from typing import Optional
+import time
+from typing import List, Optional
 from ..config.settings import ServerSettings
 from ..core.order_book import OrderBook
-from ..core.matching_engine import MatchingEngine
+from ..core.auction import CallAuction
+from ..core.depth_index import DepthIndex
+from ..core.matching_engine import MatchingEngine, Trade
 from ..core.order import Order
+from ..core.trade_tape import TradeTape
+from ..core.bars import BarBuilder
+from .journal import EventJournal
 
 
 class TradingServer:
     def __init__(self, settings: ServerSettings):
         self.settings = settings
         self.logger = logging.getLogger(__name__)
-        self.order_book = OrderBook()
+        self.order_book = OrderBook(DepthIndex(settings.tick_size))
         self.matching_engine = MatchingEngine(self.order_book)
+        self.auction = CallAuction(self.order_book)
+        self.matching_mode = "continuous"
+        self.set_matching_mode(settings.matching_mode)
+        self.trade_tape = TradeTape()
+        # In-house intraday bars built from our own fills
+        self.bar_builder = BarBuilder(settings.bar_specs)
+        # Replicas tail the journal to serve market data; none by default
+        self.journal: Optional[EventJournal] = None
+        if settings.journal_path:
+            self.journal = EventJournal(settings.journal_path)
+        self._last_snapshot = time.monotonic()
+        self._last_auction = time.monotonic()
         self._running = False
         self._match_task: Optional[asyncio.Task] = None
 
@@ -50,15 +68,23 @@ class TradingServer:
             except asyncio.CancelledError:
                 pass
 
+        if self.journal is not None:
+            self.journal.write_snapshot(self.order_book, self.trade_tape)
+            self.journal.close()
+
         self.logger.info("Trading server stopped")
 
+    def _journal(self) -> Optional[EventJournal]:
+        """The event journal, reopened (appending) if ``stop`` closed it"""
+        if self.journal is not None and self.journal.closed:
+            self.journal = EventJournal(self.settings.journal_path)
+        return self.journal
+
     async def _matching_loop(self):
         """Background task that continuously matches orders."""
         try:
             while self._running:
-                trades = self.matching_engine.match_orders()
-                if trades:
-                    self.logger.info(f"Executed {len(trades)} trades")
+                self._match_once()
                 await asyncio.sleep(0.1)  # Adjust frequency as needed
         except asyncio.CancelledError:
             self.logger.info("Matching loop cancelled")
@@ -67,6 +93,57 @@ class TradingServer:
             self.logger.error(f"Error in matching loop: {e}", exc_info=True)
             raise
 
+    def set_matching_mode(self, mode: str):
+        """
+        Switch between continuous matching and periodic call auctions.
+
+        Auction mode suits opening/closing auctions and volatility
+        interruptions: orders accumulate and are uncrossed every
+        ``auction_interval`` seconds.
+        """
+        if mode not in ("continuous", "auction"):
+            raise ValueError(f"Unknown matching mode: {mode}")
+        if mode != self.matching_mode:
+            self.logger.info(f"Switching matching mode to {mode}")
+        self.matching_mode = mode
+        self._last_auction = time.monotonic()
+
+    def run_auction(self) -> List[Trade]:
+        """Uncross the book immediately at a single clearing price."""
+        tape = self.trade_tape
+        reference = float(tape.prices[-1]) if len(tape) else None
+        self._last_auction = time.monotonic()
+        return self._record(self.auction.uncross(reference))
+
+    def _match_once(self) -> List[Trade]:
+        """Match crossing orders, record the trades and bars, and publish to the journal."""
+        if self.matching_mode == "auction":
+            if time.monotonic() - self._last_auction >= self.settings.auction_interval:
+                return self.run_auction()
+            return self._record([])
+        return self._record(self.matching_engine.match_orders())
+
+    def _record(self, trades: List[Trade]) -> List[Trade]:
+        now = time.time_ns()
+        if trades:
+            self.trade_tape.extend(trades, now)
+            self.bar_builder.on_trades(trades, now)
+            self.logger.info(f"Executed {len(trades)} trades")
+        self.bar_builder.flush(now)
+
+        journal = self._journal()
+        if journal is not None:
+            # Same (possibly clamped) time the tape recorded, so replicas agree
+            stamped = int(self.trade_tape.timestamps[-1]) if trades else None
+            for trade in trades:
+                journal.record_trade(trade, stamped)
+            journal.flush()
+            if time.monotonic() - self._last_snapshot >= self.settings.snapshot_interval:
+                journal.write_snapshot(self.order_book, self.trade_tape)
+                self._last_snapshot = time.monotonic()
+
+        return trades
+
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handle individual client connections."""
         # This is a placeholder for handling client connections
@@ -88,6 +165,14 @@ class TradingServer:
             self.logger.warning(f"Order {order.order_id} price below minimum")
             return False
 
+        if order.order_id in self.order_book.orders:
+            self.logger.warning(f"Duplicate order ID: {order.order_id}")
+            return False
+
+        # Journal first so a failed write leaves the book untouched
+        journal = self._journal()
+        if journal is not None:
+            journal.record_add(order)
         return self.order_book.add_order(order)
 
     def cancel_order(self, order_id: str) -> bool:
@@ -97,8 +182,12 @@ class TradingServer:
         Returns:
             bool: True if order was found and cancelled, False otherwise
         """
-        order = self.order_book.cancel_order(order_id)
-        if order:
-            self.logger.info(f"Cancelled order {order_id}")
-            return True
-        return False
+        if order_id not in self.order_book.orders:
+            return False
+
+        journal = self._journal()
+        if journal is not None:
+            journal.record_cancel(order_id)
+        self.order_book.cancel_order(order_id)
+        self.logger.info(f"Cancelled order {order_id}")
+        return True
@@ -2,6 +2,7 @@ import streamlit as st
 import yfinance as yf
 import pandas as pd
 import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
@@ -16,7 +17,11 @@ try:
     from src.core.order import Order, OrderSide
     from src.config.settings import ConfigLoader
     from src.server.trading_server import TradingServer
-    from src.ui.strategies import get_strategy, STRATEGIES
+    from src.backtest.strategies import get_strategy, STRATEGIES
+    from src.backtest.simulator import BookSimulator, SyntheticLiquidity
+    from src.backtest.metrics import compute_metrics
+    from src.backtest.robustness import bootstrap, entry_perturbation
+    from src.ui.downsample import bucket_ohlc, lttb_series
 except ImportError:
     # For deployment environment
     sys.path.append(os.path.dirname(os.path.dirname(
@@ -24,7 +29,38 @@ except ImportError:
     from core.order import Order, OrderSide
     from config.settings import ConfigLoader
     from server.trading_server import TradingServer
-    from ui.strategies import get_strategy, STRATEGIES
+    from backtest.strategies import get_strategy, STRATEGIES
+    from backtest.simulator import BookSimulator, SyntheticLiquidity
+    from backtest.metrics import compute_metrics
+    from backtest.robustness import bootstrap, entry_perturbation
+    from ui.downsample import bucket_ohlc, lttb_series
+
+
+# Cache lifetimes in seconds
+HISTORY_TTL = 15 * 60
+QUOTE_TTL = 60
+
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def load_history(symbol: str, period: str) -> pd.DataFrame:
+    """Price history from Yahoo Finance, shared across reruns and sessions"""
+    return yf.Ticker(symbol).history(period=period)
+
+
+def _fetch_info(symbol: str) -> dict:
+    try:
+        return yf.Ticker(symbol).info
+    except Exception:
+        return {}
+
+
+@st.cache_data(ttl=QUOTE_TTL, show_spinner=False)
+def fetch_quotes(symbols: tuple) -> dict:
+    """Quote info for several symbols, fetched concurrently"""
+    if not symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as pool:
+        return dict(zip(symbols, pool.map(_fetch_info, symbols)))
 
 
 class TradingUI:
@@ -38,11 +74,10 @@ class TradingUI:
 
     def load_stock_data(self, symbol: str, period: str = "1y"):
         """Load stock data from Yahoo Finance"""
-        stock = yf.Ticker(symbol)
-        hist = stock.history(period=period)
-        return hist
+        return load_history(symbol, period)
 
-    def run_backtest(self, symbol: str, strategy_name: str, strategy_params: dict, period: str = "1y"):
+    def run_backtest(self, symbol: str, strategy_name: str, strategy_params: dict, period: str = "1y",
+                     simulate: bool = False):
         """Run backtest for selected strategy"""
         data = self.load_stock_data(symbol, period)
 
@@ -52,15 +87,44 @@ class TradingUI:
         # Run strategy and get results
         results = strategy.generate_signals(data)
 
+        if simulate:
+            # Re-price the positions by filling them through the order book
+            simulator = BookSimulator(SyntheticLiquidity(seed=0))
+            results = simulator.run(results).data
+
         return results
 
 
+@st.cache_resource
+def get_trading_ui() -> TradingUI:
+    """One TradingUI, and so one TradingServer, per process instead of per rerun"""
+    return TradingUI()
+
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def run_backtest_cached(symbol: str, strategy_name: str, strategy_params: dict,
+                        period: str, simulate: bool) -> pd.DataFrame:
+    return get_trading_ui().run_backtest(
+        symbol, strategy_name, strategy_params, period, simulate=simulate)
+
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def run_robustness_cached(results: pd.DataFrame, method: str, n_paths: int,
+                          block_size: int, max_delay: int):
+    if method == "Block Bootstrap":
+        return bootstrap(results['Strategy_Returns'].to_numpy(), n_paths=n_paths,
+                         block_size=block_size, seed=0)
+    return entry_perturbation(results['Position'].to_numpy(),
+                              results['Returns'].to_numpy(), n_paths=n_paths,
+                              max_delay=max_delay, seed=0)
+
+
 def main():
     st.set_page_config(page_title="Trading Engine UI", layout="wide")
     st.title("Trading Engine Interface")
 
     # Initialize the trading UI
-    trading_ui = TradingUI()
+    get_trading_ui()
 
     # Sidebar for configuration
     st.sidebar.header("Configuration")
@@ -103,52 +167,86 @@ def main():
         ["1mo", "3mo", "6mo", "1y", "2y", "5y"]
     )
 
-    # Run backtest button
+    simulate = st.sidebar.checkbox("Simulate fills through order book")
+
+    watchlist = st.sidebar.text_input("Watchlist (comma separated)", "")
+
+    # Charts are downsampled server-side to roughly their pixel width
+    st.sidebar.subheader("Display")
+    max_points = st.sidebar.slider("Chart Points", 200, 5000, 1500, step=100)
+
+    # Remember the run so chart controls can rerun the script without losing it
     if st.sidebar.button("Run Backtest"):
+        st.session_state["backtest"] = {
+            "symbol": symbol,
+            "strategy_name": strategy,
+            "strategy_params": strategy_params,
+            "period": period,
+            "simulate": simulate,
+        }
+
+    request = st.session_state.get("backtest")
+    if request:
+        # Render the submitted run, not unsubmitted sidebar edits
+        strategy = request["strategy_name"]
+        strategy_params = request["strategy_params"]
         with st.spinner("Running backtest..."):
             try:
                 # Load data and run backtest with strategy parameters
-                results = trading_ui.run_backtest(
-                    symbol, strategy, strategy_params, period)
+                results = run_backtest_cached(**request)
 
                 if results is not None:
                     # Create tabs for different views
-                    tab1, tab2, tab3 = st.tabs(
-                        ["Chart", "Performance", "Trade Log"])
+                    tab1, tab2, tab3, tab4 = st.tabs(
+                        ["Chart", "Performance", "Trade Log", "Robustness"])
 
                     with tab1:
+                        # Narrowing the window brings back full resolution
+                        bars = len(results)
+                        start, end = st.select_slider(
+                            "Chart Window",
+                            options=sorted({i * (bars - 1) // 499 for i in range(500)}),
+                            value=(0, bars - 1),
+                            format_func=lambda i: results.index[i].strftime(
+                                "%Y-%m-%d %H:%M")
+                        )
+                        view = results.iloc[start:end + 1]
+
+                        def line(column):
+                            series = lttb_series(view[column], max_points)
+                            return {"x": series.index, "y": series}
+
                         # Create price chart
                         fig = go.Figure()
 
                         # Add candlestick chart
+                        candles = bucket_ohlc(
+                            view[['Open', 'High', 'Low', 'Close']], max_points)
                         fig.add_trace(go.Candlestick(
-                            x=results.index,
-                            open=results['Open'],
-                            high=results['High'],
-                            low=results['Low'],
-                            close=results['Close'],
+                            x=candles.index,
+                            open=candles['Open'],
+                            high=candles['High'],
+                            low=candles['Low'],
+                            close=candles['Close'],
                             name="OHLC"
                         ))
 
                         # Add strategy-specific indicators
                         if strategy == "SMA Crossover":
                             fig.add_trace(go.Scatter(
-                                x=results.index,
-                                y=results['SMA_Short'],
+                                **line('SMA_Short'),
                                 name=f"SMA{strategy_params['short_window']}",
                                 line=dict(color='orange')
                             ))
                             fig.add_trace(go.Scatter(
-                                x=results.index,
-                                y=results['SMA_Long'],
+                                **line('SMA_Long'),
                                 name=f"SMA{strategy_params['long_window']}",
                                 line=dict(color='blue')
                             ))
                         elif strategy == "RSI Strategy":
                             # Create a secondary y-axis for RSI
                             fig.add_trace(go.Scatter(
-                                x=results.index,
-                                y=results['RSI'],
+                                **line('RSI'),
                                 name="RSI",
                                 yaxis="y2"
                             ))
@@ -166,21 +264,18 @@ def main():
                         elif strategy == "MACD Strategy":
                             # Add MACD subplot
                             fig.add_trace(go.Scatter(
-                                x=results.index,
-                                y=results['MACD'],
+                                **line('MACD'),
                                 name="MACD",
                                 yaxis="y2"
                             ))
                             fig.add_trace(go.Scatter(
-                                x=results.index,
-                                y=results['Signal_line'],
+                                **line('Signal_line'),
                                 name="Signal Line",
                                 yaxis="y2"
                             ))
                             # Add MACD histogram
                             fig.add_trace(go.Bar(
-                                x=results.index,
-                                y=results['MACD_hist'],
+                                **line('MACD_hist'),
                                 name="MACD Histogram",
                                 yaxis="y2"
                             ))
@@ -214,22 +309,36 @@ def main():
                         st.subheader("Performance Metrics")
                         col1, col2, col3 = st.columns(3)
 
-                        total_return = (
-                            results['Cumulative_Returns'].iloc[-1] - 1) * 100
-                        sharpe_ratio = (results['Strategy_Returns'].mean(
-                        ) / results['Strategy_Returns'].std()) * (252 ** 0.5)
-                        max_drawdown = (
-                            results['Cumulative_Returns'] / results['Cumulative_Returns'].cummax() - 1).min() * 100
+                        # Simulated fills: turnover from what was actually held
+                        held = ('Held_Position' if 'Held_Position' in results
+                                else 'Position')
+                        metrics = {
+                            name: value[0] for name, value in compute_metrics(
+                                results['Strategy_Returns'].to_numpy(),
+                                positions=results[held].to_numpy()).items()
+                        }
+
+                        col1.metric("Total Return",
+                                    f"{metrics['total_return'] * 100:.2f}%")
+                        col2.metric("Sharpe Ratio",
+                                    f"{metrics['sharpe_ratio']:.2f}")
+                        col3.metric("Max Drawdown",
+                                    f"{metrics['max_drawdown'] * 100:.2f}%")
 
-                        col1.metric("Total Return", f"{total_return:.2f}%")
-                        col2.metric("Sharpe Ratio", f"{sharpe_ratio:.2f}")
-                        col3.metric("Max Drawdown", f"{max_drawdown:.2f}%")
+                        col1.metric("Sortino Ratio",
+                                    f"{metrics['sortino_ratio']:.2f}")
+                        col2.metric("Hit Rate",
+                                    f"{metrics['hit_rate'] * 100:.1f}%")
+                        col3.metric("Longest Drawdown",
+                                    f"{metrics['drawdown_duration']} bars")
 
                         # Plot cumulative returns
                         fig_returns = go.Figure()
+                        cumulative = lttb_series(
+                            results['Cumulative_Returns'], max_points)
                         fig_returns.add_trace(go.Scatter(
-                            x=results.index,
-                            y=results['Cumulative_Returns'],
+                            x=cumulative.index,
+                            y=cumulative,
                             name="Strategy Returns"
                         ))
                         fig_returns.update_layout(
@@ -248,14 +357,51 @@ def main():
                             {1: 'Buy', -1: 'Sell', 0: 'Hold'})
                         st.dataframe(signals_df.tail(10))
 
+                    with tab4:
+                        # Resampled metric distributions
+                        st.subheader("Robustness Analysis")
+                        col1, col2, col3 = st.columns(3)
+                        method = col1.selectbox(
+                            "Method", ["Block Bootstrap", "Entry Perturbation"])
+                        n_paths = col2.slider(
+                            "Paths", 1000, 20000, 10000, step=1000)
+                        if method == "Block Bootstrap":
+                            block_size = col3.slider("Block Size", 1, 60, 20)
+                            max_delay = 0
+                        else:
+                            max_delay = col3.slider("Max Entry Delay (bars)", 1, 10, 3)
+                            block_size = 0
+
+                        robustness = run_robustness_cached(
+                            results, method, n_paths, block_size, max_delay)
+
+                        for name, title, scale in [
+                            ("sharpe_ratio", "Sharpe Ratio", 1),
+                            ("total_return", "Total Return (%)", 100),
+                            ("max_drawdown", "Max Drawdown (%)", 100),
+                        ]:
+                            fig_dist = go.Figure(go.Histogram(
+                                x=robustness.metrics[name] * scale, nbinsx=60))
+                            fig_dist.update_layout(
+                                title=f"{title} across {n_paths:,} paths",
+                                xaxis_title=title, yaxis_title="Paths", height=300)
+                            st.plotly_chart(fig_dist, use_container_width=True)
+
+                        st.caption("95% confidence intervals")
+                        st.dataframe(pd.DataFrame(robustness.summary(0.95)).T)
+
             except Exception as e:
                 st.error(f"Error running backtest: {str(e)}")
 
     # Display real-time stock info
+    watched = tuple(dict.fromkeys(
+        name for name in (entry.strip().upper() for entry in watchlist.split(","))
+        if name and name != symbol))
+    quotes = fetch_quotes(((symbol,) if symbol else ()) + watched)
+
     if symbol:
         try:
-            stock = yf.Ticker(symbol)
-            info = stock.info
+            info = quotes[symbol]
 
             st.subheader("Stock Information")
             col1, col2, col3 = st.columns(3)
@@ -270,6 +416,18 @@ def main():
         except Exception as e:
             st.warning(f"Could not fetch real-time data for {symbol}")
 
+    if watched:
+        st.subheader("Watchlist")
+        st.dataframe(pd.DataFrame([
+            {
+                "Symbol": name,
+                "Price": quotes[name].get("currentPrice"),
+                "Market Cap": quotes[name].get("marketCap"),
+                "Volume": quotes[name].get("volume"),
+            }
+            for name in watched
+        ]))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of at most ``threshold`` points that preserve the
+    visual shape of the line (x, y). The first and last points are always
+    kept. Values must be finite; drop NaNs before calling.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third vertex of the triangle
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    indices[-1] = n - 1
+    return indices
+
+
+def lttb_series(series: pd.Series, threshold: int) -> pd.Series:
+    """Downsample a time-indexed series with LTTB, skipping NaNs"""
+    series = series.dropna()
+    if len(series) <= threshold:
+        return series
+    index = series.index
+    x = index.asi8 if isinstance(index, pd.DatetimeIndex) else np.arange(len(series))
+    return series.iloc[lttb(x, series.to_numpy(), threshold)]
+
+
+def bucket_ohlc(data: pd.DataFrame, buckets: int) -> pd.DataFrame:
+    """
+    Merge consecutive candles into at most ``buckets`` candles.
+
+    Each bucket keeps the first open, highest high, lowest low and last
+    close, so price extremes survive the reduction. The bucket is stamped
+    with the time of its first candle.
+    """
+    if len(data) <= buckets:
+        return data
+    groups = np.arange(len(data)) * buckets // len(data)
+    merged = data.groupby(groups).agg(
+        {"Open": "first", "High": "max", "Low": "min", "Close": "last"})
+    merged.index = data.index[np.flatnonzero(np.diff(groups, prepend=-1))]
+    return merged
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from src.config.settings import ServerSettings
+from src.core.auction import CallAuction
+from src.core.bars import BarSpec
+from src.core.depth_index import DepthIndex
+from src.core.order import Order, OrderSide
+from src.core.order_book import OrderBook
+from src.server.trading_server import TradingServer
+
+
+class TestCallAuction(unittest.TestCase):
+    def setUp(self):
+        self.book = OrderBook(DepthIndex(1.0))
+        self.auction = CallAuction(self.book)
+
+    def add(self, order_id, price, quantity, side):
+        self.book.add_order(Order(order_id, price, quantity, side))
+
+    def test_clearing_price_maximises_volume(self):
+        """Test the clearing price is the one with the most executable volume"""
+        self.add("B1", 101.0, 10, OrderSide.BUY)
+        self.add("B2", 100.0, 20, OrderSide.BUY)
+        self.add("S1", 99.0, 15, OrderSide.SELL)
+        self.add("S2", 100.0, 10, OrderSide.SELL)
+        self.add("S3", 101.0, 50, OrderSide.SELL)
+        self.assertEqual(self.auction.clearing_price(), (100.0, 25))
+
+    def test_uncross_allocates_in_price_time_priority(self):
+        """Test fills follow price-time priority and all trade at one price"""
+        self.add("B1", 101.0, 10, OrderSide.BUY)
+        self.add("B2", 100.0, 20, OrderSide.BUY)
+        self.add("B3", 100.0, 20, OrderSide.BUY)
+        self.add("S1", 99.0, 15, OrderSide.SELL)
+        self.add("S2", 100.0, 10, OrderSide.SELL)
+
+        trades = self.auction.uncross()
+
+        pairs = [(t.buy_order.order_id, t.sell_order.order_id, t.quantity) for t in trades]
+        self.assertEqual(pairs, [("B1", "S1", 10), ("B2", "S1", 5), ("B2", "S2", 10)])
+        self.assertTrue(all(t.price == 100.0 for t in trades))
+        self.assertEqual(self.book.top_levels(OrderSide.BUY, 5), [(100.0, 25)])
+        self.assertIsNone(self.book.get_best_ask())
+        self.assertEqual(self.book.depth.total_depth(OrderSide.BUY), 25)
+        self.assertEqual(self.book.depth.total_depth(OrderSide.SELL), 0)
+
+    def test_ties_broken_by_reference_price(self):
+        """Test equal-volume, equal-imbalance prices resolve towards the reference"""
+        self.add("B1", 102.0, 10, OrderSide.BUY)
+        self.add("S1", 98.0, 10, OrderSide.SELL)
+        self.assertEqual(self.auction.clearing_price(), (98.0, 10))
+        self.add("B2", 98.0, 5, OrderSide.BUY)
+        self.add("S2", 102.0, 5, OrderSide.SELL)
+        self.assertEqual(self.auction.clearing_price(101.0), (102.0, 10))
+        self.assertEqual(self.auction.clearing_price(97.0), (98.0, 10))
+
+    def test_no_cross(self):
+        """Test an uncrossed book produces no trades"""
+        self.add("B1", 99.0, 10, OrderSide.BUY)
+        self.add("S1", 100.0, 10, OrderSide.SELL)
+        self.assertEqual(self.auction.uncross(), [])
+        self.assertEqual(len(self.book.orders), 2)
+
+
+class TestAuctionMode(unittest.TestCase):
+    def test_orders_accumulate_until_auction(self):
+        """Test auction mode holds crossing orders until the interval elapses"""
+        settings = ServerSettings(port=5000, matching_mode="auction", auction_interval=0.3)
+        server = TradingServer(settings)
+
+        async def scenario():
+            await server.start()
+            server.add_order(Order("B1", 100.0, 10, OrderSide.BUY))
+            server.add_order(Order("S1", 99.0, 4, OrderSide.SELL))
+            await asyncio.sleep(0.15)
+            matched_early = len(server.trade_tape)
+            await asyncio.sleep(0.4)
+            await server.stop()
+            return matched_early
+
+        self.assertEqual(asyncio.run(scenario()), 0)
+        self.assertEqual(server.trade_tape.volume(), 4)
+        self.assertEqual(server.bar_builder.current(BarSpec.parse("tick:100")).volume, 4)
+
+    def test_invalid_mode(self):
+        """Test unknown matching modes are rejected"""
+        server = TradingServer(ServerSettings(port=5000))
+        with self.assertRaises(ValueError):
+            server.set_matching_mode("dark")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+from src.core.bars import BarBuilder, BarSeries, BarSpec, Bar
+from src.backtest.bar_feed import BarStrategyFeed
+from src.backtest.strategies import SMAStrategy
+
+SECOND = 1_000_000_000
+
+
+class TestBarBuilder(unittest.TestCase):
+    def setUp(self):
+        self.builder = BarBuilder(["time:60", "tick:3", "volume:100"])
+        self.closed = []
+        self.builder.subscribe(lambda spec, bar: self.closed.append((str(spec), bar)))
+
+    def test_time_bars(self):
+        """Test time bars align to the interval and close on the next interval"""
+        spec = BarSpec.parse("time:60")
+        self.builder.on_trade(100.0, 10, 61 * SECOND)
+        self.builder.on_trade(102.0, 5, 90 * SECOND)
+        self.builder.on_trade(99.0, 5, 119 * SECOND)
+        self.assertEqual(len(self.builder.series[spec]), 0)
+
+        self.builder.on_trade(101.0, 1, 120 * SECOND)
+        bar = self.builder.series[spec].latest()[0]
+        self.assertEqual(bar["start"], 60 * SECOND)
+        self.assertEqual((bar["open"], bar["high"], bar["low"], bar["close"]),
+                         (100.0, 102.0, 99.0, 99.0))
+        self.assertEqual((bar["volume"], bar["trades"]), (20, 3))
+
+        # An elapsed interval closes on flush without another trade
+        self.builder.flush(185 * SECOND)
+        self.assertEqual(len(self.builder.series[spec]), 2)
+        self.assertIsNone(self.builder.current(spec))
+
+    def test_tick_and_volume_bars(self):
+        """Test tick bars close on trade count and volume bars on quantity"""
+        for n, qty in enumerate([40, 30, 40, 10, 5]):
+            self.builder.on_trade(100.0 + n, qty, n * SECOND)
+
+        ticks = self.builder.series[BarSpec("tick", 3)].latest()
+        volume = self.builder.series[BarSpec("volume", 100)].latest()
+        self.assertEqual(ticks["close"].tolist(), [102.0])
+        self.assertEqual(volume["volume"].tolist(), [110])
+        self.assertEqual([name for name, _ in self.closed], ["tick:3", "volume:100"])
+        self.assertEqual(self.builder.current(BarSpec("tick", 3)).trades, 2)
+
+    def test_ring_buffer_keeps_latest(self):
+        """Test the series keeps only the newest bars, oldest first"""
+        series = BarSeries(capacity=4)
+        for n in range(10):
+            series.append(Bar(n, n, n, n, n, float(n), 1, 1))
+
+        self.assertEqual(len(series), 4)
+        self.assertEqual(series.latest()["close"].tolist(), [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(series.latest(2)["close"].tolist(), [8.0, 9.0])
+        frame = series.to_frame()
+        self.assertEqual(list(frame.columns[:5]), ["Open", "High", "Low", "Close", "Volume"])
+
+    def test_invalid_spec(self):
+        """Test unknown bar kinds and non-positive sizes are rejected"""
+        for text in ("range:5", "time", "time:0", "tick:-3", "volume:nan", "time:1e-12"):
+            with self.assertRaises(ValueError, msg=text):
+                BarSpec.parse(text)
+        with self.assertRaises(ValueError):
+            BarBuilder([BarSpec("time", 0)])
+
+
+class TestBarStrategyFeed(unittest.TestCase):
+    def test_feed_matches_batch_signals(self):
+        """Test signals on each closed bar equal a batch run over all bars"""
+        builder = BarBuilder(["tick:5"], capacity=256)
+        strategy = SMAStrategy(short_window=3, long_window=8)
+        signals = []
+        BarStrategyFeed(builder, BarSpec("tick", 5), strategy,
+                        on_signal=lambda bar, signal, position: signals.append(signal))
+
+        rng = np.random.default_rng(2)
+        prices = 100 + np.cumsum(rng.normal(0, 0.5, 500))
+        for n, price in enumerate(prices):
+            builder.on_trade(float(price), 10, n * SECOND)
+
+        batch = SMAStrategy(3, 8).generate_signals(builder.series[BarSpec("tick", 5)].to_frame())
+        self.assertEqual(len(signals), 100)
+        self.assertEqual(signals, batch["Signal"].astype(int).tolist())
@@ -0,0 +1,53 @@
+import unittest
+from benchmarks.run import compare, run_scenario
+from benchmarks.workloads import Workload, build_workloads, poisson_flow
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_workloads_are_seeded(self):
+        """Test the same seed always produces the same order flow"""
+        self.assertEqual(poisson_flow(500, seed=9), poisson_flow(500, seed=9))
+        self.assertNotEqual(poisson_flow(500, seed=9), poisson_flow(500, seed=10))
+
+    def test_cancel_ratio(self):
+        """Test cancels per add follow the requested ratio"""
+        events = poisson_flow(20_000, seed=1, cancel_ratio=0.5)
+        adds = sum(1 for e in events if e[0] == "add")
+        cancels = len(events) - adds
+
+        self.assertAlmostEqual(cancels / adds, 0.5, delta=0.05)
+
+    def test_run_scenario_reports_metrics(self):
+        """Test a small scenario reports throughput, latency and memory"""
+        workload = build_workloads(scale=0.01, names=["sweeping_aggressors"])[0]
+        result = run_scenario(workload, repeat=1)
+
+        self.assertGreater(result["trades"], 0)
+        self.assertGreater(result["events_per_second"], 0)
+        self.assertGreater(result["peak_memory_bytes"], 0)
+        self.assertEqual(set(result["latency_us"]["add"]), {"p50", "p90", "p99", "p99.9"})
+
+    def test_compare_flags_regressions(self):
+        """Test the gate trips on throughput, p99 and peak memory regressions"""
+        def suite(rate, p99, peak=1_000_000):
+            return {"scenarios": {"s": {"events_per_second": rate,
+                                        "latency_us": {"add": {"p99": p99}},
+                                        "peak_memory_bytes": peak}}}
+
+        self.assertEqual(compare(suite(1000, 10.0), suite(950, 10.5), 0.10), [])
+        self.assertEqual(len(compare(suite(1000, 10.0), suite(800, 10.0), 0.10)), 1)
+        self.assertEqual(len(compare(suite(1000, 10.0), suite(1000, 12.0), 0.10)), 1)
+        self.assertEqual(compare(suite(1000, 10.0), {"scenarios": {}}, 0.10), [])
+        self.assertEqual(len(compare(suite(1000, 10.0), suite(1000, 10.0, 1_200_000), 0.10)), 1)
+        self.assertEqual(compare(suite(1000, 10.0), suite(1000, 10.0, 1_200_000), 0.10,
+                                 memory_threshold=0.25), [])
+
+    def test_unknown_scenario(self):
+        """Test asking for a missing scenario is an error"""
+        with self.assertRaises(ValueError):
+            build_workloads(names=["nope"])
+
+    def test_empty_workload(self):
+        """Test a workload with no timed events still reports"""
+        result = run_scenario(Workload("empty"), repeat=1)
+        self.assertEqual(result["events"], 0)
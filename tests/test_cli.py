@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.backtest.cli import expand_runs, main
+from src.backtest.metrics import turnover
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestBacktestCli(unittest.TestCase):
+    def test_startup_imports_stay_light(self):
+        """Test importing the runner pulls in no UI, network or data libraries"""
+        code = ("import sys, src.backtest.cli; "
+                "print(sorted(m for m in ('pandas', 'numpy', 'streamlit', 'plotly', 'yfinance') "
+                "if m in sys.modules))")
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual(output.strip(), "[]")
+
+    def test_expand_grid(self):
+        """Test grid parameters expand into one run per combination"""
+        runs = expand_runs({
+            "defaults": {"data": "bars.csv"},
+            "runs": [{"name": "sma", "strategy": "SMA Crossover",
+                      "params": {"short_window": 5},
+                      "grid": {"long_window": [20, 40], "short_window": [3, 5]}}],
+        })
+
+        self.assertEqual([r["name"] for r in runs], ["sma-0", "sma-1", "sma-2", "sma-3"])
+        self.assertEqual(runs[1]["params"], {"short_window": 5, "long_window": 20})
+        self.assertTrue(all(r["data"] == "bars.csv" for r in runs))
+
+    def test_run_job(self):
+        """Test a job file runs in memory, chunked and simulated"""
+        rng = np.random.default_rng(3)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 400)))
+        bars = pd.DataFrame({"Close": close},
+                            index=pd.date_range("2023-01-01", periods=400, freq="D"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            bars.to_csv(os.path.join(tmp, "bars.csv"))
+            job = {
+                "output_dir": "out",
+                "defaults": {"data": "bars.csv", "strategy": "SMA Crossover",
+                             "params": {"short_window": 5, "long_window": 20}},
+                "runs": [
+                    {"name": "memory"},
+                    {"name": "chunked", "chunksize": 64},
+                    {"name": "simulated", "simulate": True,
+                     "liquidity": {"depth": 500, "seed": 1}},
+                    {"name": "broken", "strategy": "Nope"},
+                ],
+            }
+            job_path = os.path.join(tmp, "job.json")
+            with open(job_path, "w") as f:
+                json.dump(job, f)
+
+            status = main([job_path, "--log-level", "WARNING"])
+            with open(os.path.join(tmp, "out", "summary.json")) as f:
+                summary = {entry["name"]: entry for entry in json.load(f)}
+            written = sorted(os.listdir(os.path.join(tmp, "out")))
+            simulated = pd.read_csv(os.path.join(tmp, "out", "simulated.csv"))
+
+        self.assertEqual(status, 1)
+        self.assertEqual(summary["broken"]["status"], "error")
+        self.assertEqual(set(summary["chunked"]["metrics"]), set(summary["memory"]["metrics"]))
+        self.assertEqual(written, ["chunked.csv", "memory.csv", "simulated.csv", "summary.json"])
+        self.assertAlmostEqual(summary["memory"]["metrics"]["total_return"],
+                               summary["chunked"]["metrics"]["total_return"])
+        # Simulated turnover counts what was actually held, not the target signal
+        self.assertAlmostEqual(summary["simulated"]["metrics"]["turnover"],
+                               float(turnover(simulated["Held_Position"].to_numpy())[0]))
+
+    def test_run_without_strategy_is_reported(self):
+        """Test a run missing its strategy fails alone and summary.json is still written"""
+        with tempfile.TemporaryDirectory() as tmp:
+            job_path = os.path.join(tmp, "job.json")
+            with open(job_path, "w") as f:
+                json.dump({"runs": [{"name": "bare", "data": "bars.csv"}]}, f)
+
+            status = main([job_path, "--log-level", "CRITICAL"])
+            with open(os.path.join(tmp, "results", "summary.json")) as f:
+                summary = json.load(f)
+
+        self.assertEqual(status, 1)
+        self.assertEqual(summary[0]["status"], "error")
+        self.assertIsNone(summary[0]["strategy"])
+        self.assertIn("strategy", summary[0]["error"])
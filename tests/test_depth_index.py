@@ -0,0 +1,140 @@
+import random
+import unittest
+from src.core.order import Order, OrderSide
+from src.core.order_book import OrderBook
+from src.core.matching_engine import MatchingEngine
+from src.core.depth_index import DepthIndex
+
+
+def walk_cost(book, side, quantity):
+    """Reference answer: walk the sorted resting levels"""
+    levels = book.asks if side == OrderSide.BUY else book.bids
+    prices = sorted(levels, reverse=side == OrderSide.SELL)
+    filled, notional = 0, 0.0
+    for price in prices:
+        take = min(quantity - filled, sum(o.remaining_quantity for o in levels[price]))
+        filled += take
+        notional += take * price
+        if filled == quantity:
+            break
+    return filled, notional
+
+
+class TestDepthIndex(unittest.TestCase):
+    def setUp(self):
+        # Small initial range so the random flow forces re-centring
+        self.order_book = OrderBook(DepthIndex(tick_size=0.01, levels=16))
+        self.matching_engine = MatchingEngine(self.order_book, log_trades=False)
+        self.depth = self.order_book.depth
+
+    def test_depth_queries(self):
+        """Test depth at a price, within N ticks and the cost to fill"""
+        self.order_book.add_order(Order("S1", 100.01, 100, OrderSide.SELL))
+        self.order_book.add_order(Order("S2", 100.01, 50, OrderSide.SELL))
+        self.order_book.add_order(Order("S3", 100.03, 200, OrderSide.SELL))
+        self.order_book.add_order(Order("B1", 99.99, 70, OrderSide.BUY))
+
+        self.assertEqual(self.depth.depth_at_price(OrderSide.SELL, 100.01), 150)
+        self.assertEqual(self.depth.cumulative_depth(OrderSide.SELL, 100.02), 150)
+        self.assertEqual(self.depth.quantity_within(OrderSide.SELL, 1), 150)
+        self.assertEqual(self.depth.quantity_within(OrderSide.SELL, 2), 350)
+        self.assertAlmostEqual(self.depth.best_price(OrderSide.BUY), 99.99)
+
+        filled, notional = self.depth.fill_cost(OrderSide.BUY, 250)
+        self.assertEqual(filled, 250)
+        self.assertAlmostEqual(notional, 150 * 100.01 + 100 * 100.03)
+        self.assertAlmostEqual(self.depth.impact_cost(OrderSide.BUY, 250),
+                               (notional / 250 - 100.01) / 100.01)
+        # More than is resting only fills what is there
+        self.assertEqual(self.depth.fill_cost(OrderSide.SELL, 1_000)[0], 70)
+
+    def test_tracks_fills_and_cancels(self):
+        """Test the index follows matching and cancellation"""
+        self.order_book.add_order(Order("S1", 100.0, 100, OrderSide.SELL))
+        self.order_book.add_order(Order("B1", 100.0, 30, OrderSide.BUY))
+        self.matching_engine.match_orders()
+
+        self.assertEqual(self.depth.depth_at_price(OrderSide.SELL, 100.0), 70)
+        self.assertEqual(self.depth.total_depth(OrderSide.BUY), 0)
+
+        self.order_book.cancel_order("S1")
+        self.assertEqual(self.depth.total_depth(OrderSide.SELL), 0)
+        self.assertIsNone(self.depth.vwap_to_fill(OrderSide.BUY, 10))
+
+    def test_outlier_prices_stay_bounded(self):
+        """Test far-away prices neither grow the index nor break queries"""
+        depth = DepthIndex(tick_size=0.01)
+        book = OrderBook(depth)
+        book.add_order(Order("B1", 100.0, 10, OrderSide.BUY))
+        book.add_order(Order("S1", 100_000.0, 5, OrderSide.SELL))
+        book.add_order(Order("S2", 100.01, 20, OrderSide.SELL))
+        book.add_order(Order("S3", 1_000_000.0, 5, OrderSide.SELL))
+        book.add_order(Order("B2", 0.01, 7, OrderSide.BUY))
+
+        for side_index in depth._sides.values():
+            self.assertEqual(side_index.size, 4096)
+        self.assertAlmostEqual(depth.best_price(OrderSide.SELL), 100.01)
+        self.assertEqual(depth.total_depth(OrderSide.SELL), 30)
+        self.assertEqual(depth.cumulative_depth(OrderSide.SELL, 200_000.0), 25)
+        self.assertEqual(depth.depth_at_price(OrderSide.SELL, 1_000_000.0), 5)
+        self.assertEqual(depth.fill_cost(OrderSide.SELL, 20), (17, 100.0 * 10 + 0.01 * 7))
+        filled, notional = depth.fill_cost(OrderSide.BUY, 25)
+        self.assertEqual(filled, 25)
+        self.assertAlmostEqual(notional, 20 * 100.01 + 5 * 100_000.0)
+
+        # Once the touch is gone the window follows it to the outlier
+        book.cancel_order("S2")
+        self.assertAlmostEqual(depth.best_price(OrderSide.SELL), 100_000.0)
+        self.assertEqual(depth.quantity_within(OrderSide.SELL, 0), 5)
+
+    def test_stale_outlier_does_not_recentre_on_churn(self):
+        """Test refilling the touch beside a far-away order never re-centres the window"""
+        depth = DepthIndex(tick_size=0.01)
+        book = OrderBook(depth)
+        engine = MatchingEngine(book, log_trades=False)
+        book.add_order(Order("STALE", 10_000.0, 1, OrderSide.SELL))
+        book.add_order(Order("S0", 100.0, 10, OrderSide.SELL))
+
+        asks = depth._sides[OrderSide.SELL]
+        recentres = []
+        original = asks._recentre
+        asks._recentre = lambda anchor: (recentres.append(anchor), original(anchor))
+        for n in range(1, 200):
+            book.add_order(Order(f"B{n}", 100.0, 10, OrderSide.BUY))
+            engine.match_orders()
+            self.assertAlmostEqual(depth.best_price(OrderSide.SELL), 10_000.0)
+            book.add_order(Order(f"S{n}", 100.0, 10, OrderSide.SELL))
+            self.assertAlmostEqual(depth.best_price(OrderSide.SELL), 100.0)
+
+        self.assertEqual(recentres, [])
+        self.assertEqual(depth.fill_cost(OrderSide.BUY, 11), (11, 10 * 100.0 + 10_000.0))
+
+    def test_matches_book_walk_under_random_flow(self):
+        """Test every query against walking the book after random changes"""
+        rng = random.Random(5)
+        live = []
+        for n in range(3_000):
+            if live and rng.random() < 0.3:
+                self.order_book.cancel_order(live.pop(rng.randrange(len(live))))
+            else:
+                side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+                tick = rng.randint(9_900, 10_100) + (n // 100) * 20  # drifts
+                order_id = f"O{n}"
+                self.order_book.add_order(
+                    Order(order_id, round(tick * 0.01, 2), rng.randint(1, 100), side))
+                live.append(order_id)
+                self.matching_engine.match_orders()
+
+            if n % 100 == 0:
+                for side in (OrderSide.BUY, OrderSide.SELL):
+                    quantity = rng.randint(1, 2_000)
+                    filled, notional = self.depth.fill_cost(side, quantity)
+                    expected_filled, expected_notional = walk_cost(
+                        self.order_book, side, quantity)
+                    self.assertEqual(filled, expected_filled)
+                    self.assertAlmostEqual(notional, expected_notional, places=6)
+
+                self.assertAlmostEqual(self.depth.best_price(OrderSide.BUY),
+                                       self.order_book.get_best_bid())
+                self.assertAlmostEqual(self.depth.best_price(OrderSide.SELL),
+                                       self.order_book.get_best_ask())
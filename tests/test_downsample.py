@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.ui.downsample import bucket_ohlc, lttb, lttb_series
+
+
+class TestDownsample(unittest.TestCase):
+    def test_lttb_keeps_endpoints_and_spikes(self):
+        """Test LTTB returns the requested size and keeps outliers"""
+        y = np.sin(np.linspace(0, 20, 10_000))
+        y[5_000] = 10.0
+        indices = lttb(np.arange(len(y)), y, 500)
+
+        self.assertEqual(len(indices), 500)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], len(y) - 1)
+        self.assertIn(5_000, indices)
+        self.assertTrue((np.diff(indices) > 0).all())
+
+    def test_lttb_short_input_is_untouched(self):
+        """Test series already under the threshold are returned whole"""
+        self.assertEqual(lttb([0, 1, 2], [1.0, 2.0, 3.0], 10).tolist(), [0, 1, 2])
+
+    def test_lttb_series_skips_nans(self):
+        """Test indicator warm-up NaNs are dropped before sampling"""
+        index = pd.date_range("2024-01-01", periods=1_000, freq="min")
+        series = pd.Series(np.arange(1_000, dtype=float), index=index)
+        series.iloc[:50] = np.nan
+
+        sampled = lttb_series(series, 100)
+
+        self.assertEqual(len(sampled), 100)
+        self.assertFalse(sampled.isna().any())
+        self.assertEqual(sampled.index[0], index[50])
+
+    def test_bucket_ohlc_preserves_extremes(self):
+        """Test merged candles keep open, high, low and close"""
+        index = pd.date_range("2024-01-01", periods=1_000, freq="min")
+        close = np.linspace(100, 110, 1_000)
+        data = pd.DataFrame({"Open": close, "High": close + 1,
+                             "Low": close - 1, "Close": close}, index=index)
+        data.iloc[321, data.columns.get_loc("High")] = 500.0
+
+        merged = bucket_ohlc(data, 100)
+
+        self.assertEqual(len(merged), 100)
+        self.assertEqual(merged.index[0], index[0])
+        self.assertEqual(merged["Open"].iloc[0], data["Open"].iloc[0])
+        self.assertEqual(merged["Close"].iloc[-1], data["Close"].iloc[-1])
+        self.assertEqual(merged["High"].max(), 500.0)
+        self.assertEqual(merged["Low"].min(), data["Low"].min())
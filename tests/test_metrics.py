@@ -0,0 +1,78 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.backtest import metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.returns = rng.normal(0.0005, 0.01, size=(4, 300))
+        self.returns[:, 0] = np.nan  # like the first row of Strategy_Returns
+
+    def test_matches_single_run_pandas(self):
+        """Test each run agrees with the per-column pandas calculation"""
+        result = metrics.compute_metrics(self.returns)
+
+        for i, row in enumerate(self.returns):
+            series = pd.Series(row)
+            equity = (1 + series.fillna(0)).cumprod()
+            self.assertAlmostEqual(result["total_return"][i], equity.iloc[-1] - 1)
+            self.assertAlmostEqual(
+                result["sharpe_ratio"][i], series.mean() / series.std() * 252 ** 0.5)
+            self.assertAlmostEqual(
+                result["max_drawdown"][i],
+                min((equity / equity.cummax().clip(lower=1) - 1).min(), 0))
+
+    def test_drawdown_duration(self):
+        """Test the longest stretch below a previous peak"""
+        returns = np.array([[0.1, -0.1, 0.0, 0.05, 0.1, -0.01, 0.02]])
+
+        self.assertEqual(metrics.drawdown_duration(returns)[0], 3)
+        np.testing.assert_allclose(metrics.max_drawdown(returns), [-0.1])
+
+    def test_turnover_and_hit_rate(self):
+        """Test turnover from positions and hit rate from returns"""
+        positions = np.array([[0, 1, 1, -1, -1], [1, 1, 1, 1, 1]])
+        returns = np.array([[np.nan, 0.01, -0.02, 0.0, 0.03],
+                            [np.nan, 0.01, 0.01, 0.01, -0.01]])
+
+        np.testing.assert_allclose(metrics.turnover(positions), [0.75, 0.0])
+        np.testing.assert_allclose(metrics.hit_rate(returns), [2 / 3, 0.75])
+
+    def test_rolling_matches_pandas(self):
+        """Test rolling Sharpe and return against pandas rolling windows"""
+        window = 20
+        rolling = metrics.rolling_sharpe(self.returns, window)
+        growth = metrics.rolling_return(self.returns, window)
+
+        series = pd.Series(self.returns[2])
+        expected = series.rolling(window, min_periods=2).mean() / \
+            series.rolling(window, min_periods=2).std() * 252 ** 0.5
+        np.testing.assert_allclose(rolling[2, window:], expected[window:], rtol=1e-6)
+        self.assertTrue(np.isnan(rolling[2, :window - 1]).all())
+
+        compounded = (1 + series.fillna(0)).rolling(window).apply(np.prod, raw=True) - 1
+        np.testing.assert_allclose(growth[2, window - 1:], compounded[window - 1:])
+
+    def test_accumulator_matches_compute_metrics(self):
+        """Test chunk-by-chunk accumulation equals the one-pass metrics"""
+        rng = np.random.default_rng(4)
+        returns = self.returns[1]
+        positions = rng.integers(-1, 2, size=returns.shape[0])
+        expected = metrics.compute_metrics(returns, positions=positions)
+
+        accumulator = metrics.MetricsAccumulator()
+        for chunk in np.array_split(np.arange(returns.shape[0]), 7):
+            accumulator.update(returns[chunk], positions[chunk])
+        result = accumulator.result()
+
+        self.assertEqual(set(result), set(expected))
+        for name, value in expected.items():
+            self.assertAlmostEqual(result[name], value[0], msg=name)
+
+    def test_rank_runs(self):
+        """Test ranking puts the best run first and NaNs last"""
+        ranked = metrics.rank_runs({"sharpe_ratio": np.array([0.5, np.nan, 2.0, 1.0])})
+
+        self.assertEqual(ranked.tolist(), [2, 3, 0, 1])
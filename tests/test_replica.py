@@ -0,0 +1,213 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from src.config.settings import ServerSettings
+from src.core.order import Order, OrderSide
+from src.server.trading_server import TradingServer
+from src.server.replica import ReplicaEngine, ReplicaServer
+
+
+class TestReplica(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmp.name, "engine.journal")
+        self.settings = ServerSettings(port=12000, journal_path=self.journal_path,
+                                       snapshot_interval=3600)
+        self.primary = TradingServer(self.settings)
+
+    def tearDown(self):
+        self.primary.journal.close()
+        self.tmp.cleanup()
+
+    def trade_some(self, start=0):
+        for n in range(start, start + 20):
+            self.primary.add_order(Order(f"B{n}", 100.0 - n % 5, 10, OrderSide.BUY))
+            self.primary.add_order(Order(f"S{n}", 99.0 + n % 7, 7, OrderSide.SELL))
+            if n % 3 == 0:
+                self.primary.cancel_order(f"B{n}")
+            self.primary._match_once()
+
+    def assert_same_book(self, replica):
+        for side in (OrderSide.BUY, OrderSide.SELL):
+            self.assertEqual(replica.order_book.top_levels(side, 50),
+                             self.primary.order_book.top_levels(side, 50))
+        self.assertEqual(replica.trade_tape.column("price").tolist(),
+                         self.primary.trade_tape.column("price").tolist())
+        self.assertEqual(replica.trade_tape.timestamps.tolist(),
+                         self.primary.trade_tape.timestamps.tolist())
+        self.assertEqual(replica.seq, self.primary.journal.seq)
+
+    def test_replica_tracks_primary(self):
+        """Test a replica tailing the journal rebuilds the primary's book and trades"""
+        replica = ReplicaEngine(self.journal_path)
+        self.trade_some()
+        replica.poll()
+        self.assert_same_book(replica)
+
+        self.trade_some(start=20)
+        self.assertGreater(replica.status()["lag_bytes"], 0)
+        replica.poll()
+        self.assert_same_book(replica)
+        self.assertEqual(replica.status()["lag_bytes"], 0)
+
+    def test_partial_line_waits(self):
+        """Test a half-written event is applied only once complete"""
+        replica = ReplicaEngine(self.journal_path)
+        self.trade_some()
+        with open(self.journal_path, "ab") as f:
+            f.write(b'{"type":"cancel"')
+        replica.poll()
+
+        self.assert_same_book(replica)
+
+    def test_resync_from_snapshot_when_behind(self):
+        """Test a lagging replica jumps to the snapshot and tails on from there"""
+        self.trade_some()
+        self.primary.journal.write_snapshot(self.primary.order_book, self.primary.trade_tape)
+        self.trade_some(start=20)
+        self.primary.journal.flush()
+
+        replica = ReplicaEngine(self.journal_path, max_lag_bytes=100)
+        replica.poll()
+
+        self.assertEqual(replica.resyncs, 1)
+        self.assert_same_book(replica)
+
+    def test_lagging_without_newer_snapshot_keeps_tailing(self):
+        """Test a lagging replica never resets or moves back to an older snapshot"""
+        self.trade_some()
+        replica = ReplicaEngine(self.journal_path, max_lag_bytes=100)
+        replica.poll()
+        self.assertEqual(replica.resyncs, 0)
+        self.assert_same_book(replica)
+
+        self.primary.journal.write_snapshot(self.primary.order_book, self.primary.trade_tape)
+        self.trade_some(start=20)
+        replica.poll()  # the snapshot is at the replica's own offset
+        self.trade_some(start=40)
+        with open(replica.snapshot_path) as f:
+            self.assertLess(json.load(f)["offset"], replica.offset)
+        replica.poll()
+
+        self.assertEqual(replica.resyncs, 0)
+        self.assert_same_book(replica)
+
+    def test_stop_closes_journal(self):
+        """Test stopping the primary closes the journal and the next write reopens it"""
+        async def cycle(order_id):
+            await self.primary.start()
+            self.assertTrue(self.primary.add_order(Order(order_id, 99.0, 1, OrderSide.BUY)))
+            self.assertFalse(self.primary.journal.closed)
+            await self.primary.stop()
+
+        asyncio.run(cycle("B1"))
+        self.assertTrue(self.primary.journal.closed)
+        asyncio.run(cycle("B2"))
+        self.assertTrue(self.primary.journal.closed)
+        self.assertEqual(self.primary.journal.seq, 2)
+
+    def test_orders_after_stop_are_journalled(self):
+        """Test add and cancel on a stopped server reopen the journal and stay in step"""
+        async def cycle():
+            await self.primary.start()
+            await self.primary.stop()
+
+        asyncio.run(cycle())
+        self.assertTrue(self.primary.add_order(Order("X", 99.0, 5, OrderSide.BUY)))
+        self.assertTrue(self.primary.cancel_order("X"))
+        self.assertFalse(self.primary.cancel_order("X"))
+        self.primary.journal.flush()
+
+        with open(self.journal_path) as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual([(e["type"], e["order_id"]) for e in events],
+                         [("add", "X"), ("cancel", "X")])
+        self.assertNotIn("X", self.primary.order_book.orders)
+
+    def test_failed_journal_write_leaves_book_unchanged(self):
+        """Test the book is only changed once the event is journalled"""
+        def fail(*args):
+            raise OSError("disk full")
+
+        self.primary.journal.record_add = fail
+        with self.assertRaises(OSError):
+            self.primary.add_order(Order("Y", 99.0, 5, OrderSide.BUY))
+        self.assertNotIn("Y", self.primary.order_book.orders)
+
+    def test_poll_is_bounded(self):
+        """Test one poll applies at most read_size bytes and later polls catch up"""
+        self.trade_some()
+        self.trade_some(start=20)
+        self.primary.journal.flush()
+        replica = ReplicaEngine(self.journal_path, read_size=512)
+
+        first = replica.poll()
+        self.assertGreater(first, 0)
+        self.assertLess(first, self.primary.journal.seq)
+        self.assertLessEqual(replica.offset, 512)
+        while replica.poll():
+            pass
+        self.assert_same_book(replica)
+
+    def test_queries_answered_while_catching_up(self):
+        """Test the query server interleaves answers with catch-up batches"""
+        for start in range(0, 200, 20):
+            self.trade_some(start=start)
+        self.primary.journal.flush()
+
+        async def scenario():
+            replica = ReplicaEngine(self.journal_path, read_size=256)
+            server = ReplicaServer(replica, poll_interval=0.01)
+            port = await server.start()
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            seen = []
+            while not seen or seen[-1] < self.primary.journal.seq:
+                writer.write(b'{"type": "status"}\n')
+                await writer.drain()
+                seen.append(json.loads(await reader.readline())["seq"])
+            writer.close()
+            await server.stop()
+            return seen
+
+        seen = asyncio.run(scenario())
+        # Answers arrived at several points along the way, not only once caught up
+        self.assertGreater(len(set(seen)), 2)
+
+    def test_queries(self):
+        """Test book, depth, fill cost and trade queries"""
+        self.trade_some()
+        replica = ReplicaEngine(self.journal_path)
+        replica.poll()
+
+        book = replica.handle_query({"type": "book", "levels": 2})
+        self.assertEqual(book["bids"], self.primary.order_book.top_levels(OrderSide.BUY, 2))
+        best_ask, best_ask_qty = book["asks"][0]
+        depth = replica.handle_query({"type": "depth", "side": "SELL", "price": best_ask})
+        self.assertEqual(depth["at_price"], best_ask_qty)
+        cost = replica.handle_query({"type": "fill_cost", "side": "BUY", "quantity": 1})
+        self.assertAlmostEqual(cost["vwap"], best_ask)
+        trades = replica.handle_query({"type": "trades", "limit": 3})["trades"]
+        self.assertEqual(len(trades), 3)
+        self.assertIn("error", replica.handle_query({"type": "nope"}))
+
+    def test_query_server(self):
+        """Test queries over the replica's TCP socket"""
+        self.trade_some()
+
+        async def scenario():
+            server = ReplicaServer(ReplicaEngine(self.journal_path), poll_interval=0.01)
+            port = await server.start()
+            await asyncio.sleep(0.05)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"type": "status"}\n')
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            writer.close()
+            await server.stop()
+            return response
+
+        status = asyncio.run(scenario())
+        self.assertEqual(status["seq"], self.primary.journal.seq)
+        self.assertEqual(status["lag_bytes"], 0)
@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+from src.backtest import metrics, robustness
+
+
+class TestRobustness(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(21)
+        self.returns = rng.normal(0.0005, 0.01, 500)
+        self.positions = np.sign(np.sin(np.arange(500) / 12))
+
+    def test_block_bootstrap_keeps_blocks(self):
+        """Test paths are made of consecutive runs of the original series"""
+        series = np.arange(100, dtype=float)
+        paths = robustness.block_bootstrap_paths(
+            series, 50, block_size=10, rng=np.random.default_rng(0))
+
+        self.assertEqual(paths.shape, (50, 100))
+        steps = np.diff(paths.reshape(50, 10, 10), axis=2) % 100
+        self.assertTrue((steps == 1).all())
+
+    def test_bootstrap_is_seeded_and_chunked(self):
+        """Test chunking does not change the distribution for a given seed"""
+        whole = robustness.bootstrap(self.returns, 300, chunk_size=300, seed=4)
+        chunked = robustness.bootstrap(self.returns, 300, chunk_size=7, seed=4)
+
+        self.assertEqual(len(whole.metrics["sharpe_ratio"]), 300)
+        lower, upper = whole.confidence_interval("total_return", 0.99)
+        self.assertLess(lower, upper)
+        for name, values in whole.metrics.items():
+            np.testing.assert_array_equal(values, chunked.metrics[name])
+
+    def test_perturbation_is_chunk_independent(self):
+        """Test entry perturbation gives the same paths however it is chunked"""
+        whole = robustness.entry_perturbation(
+            self.positions, self.returns, n_paths=100, chunk_size=100, seed=8)
+        chunked = robustness.entry_perturbation(
+            self.positions, self.returns, n_paths=100, chunk_size=13, seed=8)
+
+        for name, values in whole.metrics.items():
+            np.testing.assert_array_equal(values, chunked.metrics[name])
+
+    def test_zero_delay_reproduces_backtest(self):
+        """Test entry perturbation without delay equals the original run"""
+        result = robustness.entry_perturbation(
+            self.positions, self.returns, n_paths=5, max_delay=0)
+
+        strategy_returns = np.concatenate([[np.nan], self.positions[:-1] * self.returns[1:]])
+        expected = metrics.compute_metrics(strategy_returns, self.positions)
+        for name, values in result.metrics.items():
+            np.testing.assert_allclose(values, np.repeat(expected[name], 5))
+
+    def test_delays_are_bounded_and_ordered(self):
+        """Test every change lands late by at most max_delay bars"""
+        positions = np.array([0, 0, 1, 1, 1, -1, -1, 0, 0, 0], dtype=float)
+        paths = robustness.perturbed_positions(
+            positions, 200, max_delay=2, rng=np.random.default_rng(1))
+
+        for path in paths:
+            changes = np.flatnonzero(np.diff(path)) + 1
+            self.assertTrue(set(path) <= {0.0, 1.0, -1.0})
+            self.assertEqual(path[-1], 0.0)
+            # The original changes are at bars 2, 5 and 7
+            self.assertTrue(2 <= changes[0] <= 4)
+            self.assertLessEqual(changes[-1], 9)
+        self.assertTrue((paths[:, :2] == 0).all())
+
+    def test_summary(self):
+        """Test the summary reports mean, median and interval per metric"""
+        summary = robustness.bootstrap(self.returns, 100, seed=2).summary(0.9)
+
+        self.assertIn("max_drawdown", summary)
+        self.assertLessEqual(summary["sharpe_ratio"]["lower"], summary["sharpe_ratio"]["median"])
+        self.assertLessEqual(summary["sharpe_ratio"]["median"], summary["sharpe_ratio"]["upper"])
@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.core.order import OrderSide
+from src.backtest.simulator import (
+    BookEvent, BookSimulator, ReplayLiquidity, SyntheticLiquidity)
+
+
+def make_data(positions, price=100.0):
+    index = pd.date_range("2024-01-01", periods=len(positions), freq="D")
+    return pd.DataFrame({
+        "Open": price,
+        "Close": price,
+        "Position": positions,
+    }, index=index)
+
+
+class TestBookSimulator(unittest.TestCase):
+    def test_fills_against_deep_liquidity(self):
+        """Test a position change fills in full on the next bar"""
+        liquidity = SyntheticLiquidity(levels=3, depth=1000, seed=1)
+        simulator = BookSimulator(liquidity, order_size=100)
+
+        result = simulator.run(make_data([1, 1, 1, -1, -1]))
+
+        holdings = result.data["Holdings"].tolist()
+        self.assertEqual(holdings, [0, 100, 100, 100, -100])
+        self.assertEqual(result.fills[0].side, OrderSide.BUY)
+        # Buying lifts the offer, one tick above the reference price
+        self.assertAlmostEqual(result.fills[0].price, 100.01)
+
+    def test_partial_fill_carries_to_next_bar(self):
+        """Test thin liquidity fills the target over several bars"""
+        quotes = {
+            step: [BookEvent("cancel", f"A{step - 1}"),
+                   BookEvent("add", f"A{step}", OrderSide.SELL, 100.0, 40)]
+            for step in range(4)
+        }
+        simulator = BookSimulator(ReplayLiquidity(quotes), order_size=100)
+
+        result = simulator.run(make_data([1, 1, 1, 1]))
+
+        self.assertEqual(result.data["Filled"].tolist(), [0, 40, 40, 20])
+        self.assertEqual(result.data["Holdings"].iloc[-1], 100)
+        self.assertEqual(result.data["Held_Position"].tolist(), [0, 0.4, 0.8, 1.0])
+
+    def test_passive_order_keeps_queue_position(self):
+        """Test a resting order fills only after the queue ahead of it"""
+        quotes = {0: [BookEvent("add", "M1", OrderSide.BUY, 99.99, 30)]}
+        flow = {
+            1: [BookEvent("add", "T1", OrderSide.SELL, 99.99, 20)],
+            2: [BookEvent("add", "T2", OrderSide.SELL, 99.99, 20)],
+        }
+        simulator = BookSimulator(
+            ReplayLiquidity(quotes, flow), order_size=10, execution="passive")
+
+        result = simulator.run(make_data([1, 1, 1]))
+
+        # T1 only reaches M1; T2 finishes M1 and then fills our bid
+        self.assertEqual(result.data["Filled"].tolist(), [0, 0, 10])
+        self.assertEqual(result.fills[0].price, 99.99)
+
+    def test_equity_tracks_close(self):
+        """Test equity and returns are marked at the close"""
+        data = make_data([1, 1, 1])
+        data["Close"] = [100.0, 102.0, 101.0]
+        simulator = BookSimulator(
+            SyntheticLiquidity(levels=2, depth=1000, seed=3), order_size=10,
+            capital=10_000.0)
+
+        result = simulator.run(data).data
+
+        expected = 10_000.0 + 10 * (np.array([100.0, 102.0, 101.0]) - 100.01)
+        expected[0] = 10_000.0
+        np.testing.assert_allclose(result["Equity"], expected)
+        self.assertAlmostEqual(result["Cumulative_Returns"].iloc[-1],
+                               expected[-1] / 10_000.0)
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.backtest.metrics import compute_metrics
+from src.backtest.strategies import SMAStrategy, RSIStrategy, MACDStrategy
+from src.backtest.streaming import ChunkedBacktest, read_chunks
+
+
+def make_history(rows=1500, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    index = pd.date_range("2020-01-01", periods=rows, freq="min")
+    return pd.DataFrame({"Close": close}, index=index)
+
+
+class TestChunkedBacktest(unittest.TestCase):
+    def setUp(self):
+        self.history = make_history()
+
+    def assert_matches_in_memory(self, strategy, chunksize):
+        expected = strategy.generate_signals(self.history.copy())
+        chunks = (self.history.iloc[i:i + chunksize].copy()
+                  for i in range(0, len(self.history), chunksize))
+        actual = pd.concat(ChunkedBacktest(strategy).run(chunks))
+
+        self.assertTrue(actual.index.equals(expected.index))
+        for column in ["Signal", "Position", "Strategy_Returns", "Cumulative_Returns"]:
+            np.testing.assert_allclose(
+                actual[column].to_numpy(float), expected[column].to_numpy(float),
+                rtol=1e-9, err_msg=column)
+
+    def test_sma_matches_in_memory(self):
+        """Test rolling windows are continued across chunk boundaries"""
+        self.assert_matches_in_memory(SMAStrategy(5, 40), chunksize=97)
+
+    def test_rsi_matches_in_memory(self):
+        """Test RSI with chunks smaller than its window"""
+        self.assert_matches_in_memory(RSIStrategy(period=14), chunksize=10)
+
+    def test_macd_matches_in_memory(self):
+        """Test EMA state is carried through the lookback"""
+        self.assert_matches_in_memory(MACDStrategy(), chunksize=250)
+
+    def test_run_file(self):
+        """Test a CSV file is backtested chunk by chunk and written out"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "ticks.csv")
+            output = os.path.join(tmp, "results.csv")
+            self.history.rename(columns={"Close": "price"}).to_csv(source)
+
+            summary = ChunkedBacktest(SMAStrategy(5, 40)).run_file(
+                source, output, chunksize=200, column_map={"price": "Close"})
+            written = pd.read_csv(output, index_col=0, parse_dates=True)
+
+        expected = SMAStrategy(5, 40).generate_signals(self.history.copy())
+        metrics = compute_metrics(expected["Strategy_Returns"].to_numpy(),
+                                  positions=expected["Position"].to_numpy())
+        self.assertEqual(summary["rows"], len(self.history))
+        self.assertEqual(len(written), len(self.history))
+        self.assertEqual(set(summary), set(metrics) | {"rows"})
+        for name, value in metrics.items():
+            self.assertAlmostEqual(summary[name], value[0], msg=name)
+
+    def test_read_chunks_renames_columns(self):
+        """Test chunked reading of a CSV file"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "bars.csv")
+            self.history.iloc[:25].rename(columns={"Close": "last"}).to_csv(source)
+
+            chunks = list(read_chunks(source, chunksize=10, column_map={"last": "Close"}))
+
+        self.assertEqual([len(c) for c in chunks], [10, 10, 5])
+        self.assertIn("Close", chunks[0].columns)
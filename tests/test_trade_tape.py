@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.core.order import Order, OrderSide
+from src.core.matching_engine import Trade
+from src.core.trade_tape import TradeTape
+
+
+def make_trade(n, price, quantity):
+    buy = Order(f"B{n}", price=price, quantity=quantity, side=OrderSide.BUY)
+    sell = Order(f"S{n}", price=price, quantity=quantity, side=OrderSide.SELL)
+    return Trade(buy, sell, price, quantity)
+
+
+class TestTradeTape(unittest.TestCase):
+    def setUp(self):
+        # Starts tiny so the tests exercise growth
+        self.tape = TradeTape(capacity=2)
+        for n in range(10):
+            self.tape.append(make_trade(n, 100.0 + n, 10 * (n + 1)), timestamp=1_000 * n)
+
+    def test_append_grows(self):
+        """Test appends past capacity keep every trade in order"""
+        self.assertEqual(len(self.tape), 10)
+        self.assertGreaterEqual(self.tape.capacity, 10)
+        self.assertEqual(self.tape.column("sequence").tolist(), list(range(1, 11)))
+        self.assertEqual(self.tape.column("buy")[3], b"B3")
+
+    def test_long_order_ids_widen_columns(self):
+        """Test an ID longer than the column width widens it without truncating"""
+        long_id = "client-7f3a9c21-order-000000001"
+        self.tape.record(101.0, 5, long_id, "S", timestamp=10_000)
+
+        self.assertEqual(self.tape.id_width, 32)  # 31 bytes rounded up
+        self.assertEqual(self.tape.column("buy")[-1].decode(), long_id)
+        self.assertEqual(self.tape.column("buy")[0], b"B0")
+        self.assertEqual(self.tape.slice(10_000)["buy"][0].decode(), long_id)
+
+    def test_time_range_queries(self):
+        """Test volume and VWAP over a half-open time range"""
+        prices = 100.0 + np.arange(2, 5)
+        quantities = 10 * np.arange(3, 6)
+
+        self.assertEqual(self.tape.index_range(2_000, 5_000), (2, 5))
+        self.assertEqual(self.tape.volume(2_000, 5_000), quantities.sum())
+        self.assertAlmostEqual(self.tape.vwap(2_000, 5_000),
+                               (prices * quantities).sum() / quantities.sum())
+        self.assertIsNone(self.tape.vwap(20_000, 30_000))
+        self.assertEqual(self.tape.volume(), 10 * sum(range(1, 11)))
+
+    def test_timestamps_never_decrease(self):
+        """Test a clock step backwards is clamped to keep the tape sorted"""
+        self.tape.append(make_trade(99, 50.0, 1), timestamp=5)
+
+        self.assertEqual(self.tape.timestamps[-1], 9_000)
+
+    def test_views_are_read_only(self):
+        """Test column views cannot corrupt the prefix sums"""
+        with self.assertRaises(ValueError):
+            self.tape.prices[0] = 1.0
+
+    def test_export(self):
+        """Test NPY and CSV export"""
+        with tempfile.TemporaryDirectory() as tmp:
+            npy = os.path.join(tmp, "tape.npy")
+            csv_path = os.path.join(tmp, "tape.csv")
+            self.tape.to_npy(npy)
+            self.tape.to_csv(csv_path)
+
+            records = np.load(npy)
+            with open(csv_path) as f:
+                lines = f.read().splitlines()
+
+        self.assertEqual(records["quantity"].tolist(), [10 * (n + 1) for n in range(10)])
+        self.assertEqual(lines[0], "sequence,timestamp,price,quantity,buy_order_id,sell_order_id")
+        self.assertEqual(lines[1], "1,0,100.0,10,B0,S0")
+        self.assertEqual(len(lines), 11)
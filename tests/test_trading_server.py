@@ -47,3 +47,17 @@ class TestTradingServer(unittest.TestCase):
     def test_server_lifecycle_sync(self):
         """Synchronous wrapper for async lifecycle test"""
         asyncio.run(self.test_server_lifecycle())
+
+    def test_trades_recorded_on_tape(self):
+        """Test the matching loop records executed trades on the tape"""
+        async def scenario():
+            await self.server.start()
+            self.server.add_order(Order("B1", 100.0, 10, OrderSide.BUY))
+            self.server.add_order(Order("S1", 100.0, 4, OrderSide.SELL))
+            await asyncio.sleep(0.2)
+            await self.server.stop()
+
+        asyncio.run(scenario())
+
+        self.assertEqual(len(self.server.trade_tape), 1)
+        self.assertEqual(self.server.trade_tape.volume(), 4)